@@ -39,6 +39,17 @@
 #     GPL-3 Licence: https://www.gnu.org/licenses/gpl-3.0.html.en
 #     Mike Turkey.com: https://miketurkey.com/
 
-from .mman import Main_manXXYY, _Main_man, main_mman, main_manenfb, main_manjpfb, main_manenob
-__version__ = Main_manXXYY.version
-__versiondate__ = Main_manXXYY.versiondate
+__all__ = ['Main_manXXYY', '_Main_man', 'main_mman',
+           'main_manenfb', 'main_manjpfb', 'main_manenob']
+
+
+def __getattr__(name: str):
+    import importlib
+    mman = importlib.import_module('.mman', __name__)
+    if name in __all__:
+        return getattr(mman, name)
+    elif name == '__version__':
+        return mman.Main_manXXYY.version
+    elif name == '__versiondate__':
+        return mman.Main_manXXYY.versiondate
+    raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3.9
+# -*- coding: utf-8 -*-
+# manjpfb, FreeBSD Japanese-Man Pager.
+# Copyright (C) 2024 MikeTurkey All rights reserved.
+# contact: voice[ATmark]miketurkey.com
+# license: GPLv3 License
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ADDITIONAL MACHINE LEARNING PROHIBITION CLAUSE
+#
+# In addition to the rights granted under the applicable license(GPL-3),
+# you are expressly prohibited from using any form of machine learning,
+# artificial intelligence, or similar technologies to analyze, process,
+# or extract information from this software, or to create derivative
+# works based on this software.
+#
+# This prohibition includes, but is not limited to, training machine
+# learning models, neural networks, or any other automated systems using
+# the code or output of this software.
+#
+# The purpose of this prohibition is to protect the integrity and
+# intended use of this software. If you wish to use this software for
+# machine learning or similar purposes, you must seek explicit written
+# permission from the copyright holder.
+#
+# see also 
+#     GPL-3 Licence: https://www.gnu.org/licenses/gpl-3.0.html.en
+#     Mike Turkey.com: https://miketurkey.com/
+
+
+import os
+import sys
+import bisect
+
+
+class Man_complete(object):
+    options: tuple = ('--help', '--version', '--showtmpdir', '--license', '--release',
+                      '--listos', '--listman', '--listman1', '--listman2', '--listman3',
+                      '--listman4', '--listman5', '--listman6', '--listman7', '--listman8',
+                      '--listman9', '--search', '-k', '--apropos', '--cachebackend', '--hotcache-size',
+                      '--paranoid', '--builtin-pager', '--cat', '--all-sections', '--bilingual',
+                      '--bilingual-interleave', '--complete', '--complete-script')
+    shells: tuple = ('bash', 'zsh', 'fish')
+
+    @staticmethod
+    def gettempdir() -> str:
+        for envname in ('TMPDIR', 'TEMP', 'TMP'):
+            dpath: str = os.environ.get(envname, '')
+            if dpath != '' and os.path.isdir(dpath):
+                return os.path.abspath(dpath)
+        if sys.platform == 'win32':
+            import tempfile
+            return tempfile.gettempdir()
+        return '/tmp'
+
+    @staticmethod
+    def find_namesfpath(cmdname: str) -> str:
+        systemtmpdir: str = Man_complete.gettempdir()
+        if sys.platform == 'win32':
+            prefix: str = 'mman_'
+        else:
+            prefix = 'mman_{0}_'.format(os.getuid())
+        fname: str = 'complete_{0}.txt'.format(cmdname)
+        newest: tuple = (0, '')
+        try:
+            entries: list = os.listdir(systemtmpdir)
+        except OSError:
+            return ''
+        for entry in entries:
+            if entry.startswith(prefix) != True:
+                continue
+            fpath: str = os.path.join(systemtmpdir, entry, fname)
+            try:
+                mtime: int = os.stat(fpath).st_mtime_ns
+            except OSError:
+                continue
+            if mtime > newest[0]:
+                newest = (mtime, fpath)
+        return newest[1]
+
+    @staticmethod
+    def complete(cmdname: str, prefix: str) -> list:
+        if prefix.startswith('-'):
+            return [opt for opt in Man_complete.options if opt.startswith(prefix)]
+        fpath: str = Man_complete.find_namesfpath(cmdname)
+        if fpath == '':
+            return list()
+        try:
+            with open(fpath, 'rt', encoding='UTF-8') as fp:
+                names: list = fp.read().splitlines()
+        except OSError:
+            return list()
+        start: int = bisect.bisect_left(names, prefix)
+        end: int = bisect.bisect_left(names, prefix + '\U0010ffff', start)
+        return names[start:end]
+
+    @staticmethod
+    def make_script(cmdname: str, shell: str) -> str:
+        opts: str = ' '.join(Man_complete.options)
+        if shell == 'bash':
+            return '\n'.join([
+                '_{0}() {{'.format(cmdname),
+                '    local cur="${COMP_WORDS[COMP_CWORD]}"',
+                '    if [[ "$cur" == -* ]]; then',
+                '        COMPREPLY=( $(compgen -W "{0}" -- "$cur") )'.format(opts),
+                '        return',
+                '    fi',
+                '    COMPREPLY=( $({0} --complete "$cur" 2>/dev/null) )'.format(
+                    cmdname),
+                '}',
+                'complete -F _{0} {0}'.format(cmdname)])
+        elif shell == 'zsh':
+            return '\n'.join([
+                '_{0}() {{'.format(cmdname),
+                '    local -a names',
+                '    if [[ "$PREFIX" == -* ]]; then',
+                '        compadd -- {0}'.format(opts),
+                '        return',
+                '    fi',
+                '    names=(${{(f)"$({0} --complete "$PREFIX" 2>/dev/null)"}})'.format(
+                    cmdname),
+                '    compadd -a names',
+                '}',
+                'compdef _{0} {0}'.format(cmdname)])
+        elif shell == 'fish':
+            return '\n'.join([
+                'complete -c {0} -f -n "string match -q -- \'-*\' (commandline -ct)" -a "{1}"'.format(
+                    cmdname, opts),
+                'complete -c {0} -f -n "not string match -q -- \'-*\' (commandline -ct)" '
+                '-a "({0} --complete (commandline -ct) 2>/dev/null)"'.format(cmdname)])
+        errmes: str = 'Error: Not supported shell. [{0}]'.format(shell)
+        raise ValueError(errmes)
+
+
+def is_complete_args(argv: list) -> bool:
+    return len(argv) >= 2 and argv[1] in ('--complete', '--complete-script')
+
+
+def main_complete(cmdname: str, argv: list | None = None):
+    argv = sys.argv if argv == None else argv
+    if is_complete_args(argv) != True:
+        errmes: str = 'Error: Not completion args.'
+        print(errmes, file=sys.stderr)
+        exit(1)
+    arg: str = argv[2] if len(argv) >= 3 else ''
+    if argv[1] == '--complete-script':
+        try:
+            print(Man_complete.make_script(cmdname, arg))
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            exit(1)
+        exit(0)
+    lines: list = Man_complete.complete(cmdname, arg)
+    if len(lines) >= 1:
+        sys.stdout.write('\n'.join(lines) + '\n')
+    exit(0)
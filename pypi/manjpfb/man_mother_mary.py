@@ -46,14 +46,28 @@ import sys
 import urllib.request
 import tomllib
 import socket
-import multiprocessing
 import typing
 import pathlib
 import tempfile
 import shutil
 import hashlib
 import gzip
+import zlib
 import base64
+import json
+import bisect
+import mmap
+import struct
+import math
+import threading
+import http.client
+import urllib.parse
+import ssl
+import random
+import email.utils
+import sqlite3
+if sys.platform != 'win32':
+    import fcntl
 try:
     from .man_socrates import MMAN_CONSTANT_SOFTWARE_LICENSE_STRING, \
         MMAN_CONSTANT_DOCLICENSE_TRANSRATED_FREEBSD_MAN, \
@@ -74,6 +88,10 @@ class MmanStdError(Exception):
     pass
 
 
+class MmanRateLimitError(TimeoutError):
+    pass
+
+
 class Mainfunc(object):
     @staticmethod
     def os2_to_general_osname(os2: str) -> str:
@@ -102,37 +120,46 @@ class Mainfunc(object):
         return retid
 
     @staticmethod
-    def geturlpath_man(rootdic: dict, vernamekey: str) -> tuple[list, str, str, str, str]:
+    def make_releaseindex(rootdic: dict) -> dict:
         mainfunc = Mainfunc
         errmes: str
-        rettpl: tuple[list, str, str, str, str]
-        reterr: tuple[list, str, str, str, str] = ([], '', '', '', '')
-        if vernamekey == '@LATEST-RELEASE':
-            timelist: list = list()
-            for tpl in mainfunc.iter_rootdic(rootdic):
-                vername, osname, status, thedate, urls = tpl
-                t = time.strptime(thedate, '%Y%m%d-%H%M%S')
-                epoch = int(time.mktime(t))
-                timelist.append(
-                    (epoch, urls, osname, status, thedate, vername))
-            if len(timelist) == 0:
-                errmes = 'Error: Unable to analyze root.toml.'
-                raise MmanStdError(errmes)
-            timelist.append((10000, ['example.com'], 'Example OS', '', '', ''))
-            timelist.sort(key=lambda x: x[0], reverse=True)
-            rettpl = timelist[0][1:]
-            return rettpl
-        matched: bool = False
+        timelist: list = list()
+        releases: dict = dict()
         for tpl in mainfunc.iter_rootdic(rootdic):
             vername, osname, status, thedate, urls = tpl
-            if vername == vernamekey:
-                matched = True
-                break
-        if matched == False:
+            t = time.strptime(thedate, '%Y%m%d-%H%M%S')
+            epoch = int(time.mktime(t))
+            timelist.append((epoch, vername))
+            releases[vername] = {'urls': urls, 'osname': osname,
+                                 'status': status, 'thedate': thedate}
+        if len(timelist) == 0:
+            errmes = 'Error: Unable to analyze root.toml.'
+            raise MmanStdError(errmes)
+        order: list = [vername for epoch, vername in timelist]
+        timelist.sort(key=lambda x: x[0], reverse=True)
+        relindex: dict = {'latest': timelist[0][1], 'order': order,
+                          'releases': releases}
+        return relindex
+
+    @staticmethod
+    def lookup_releaseindex(relindex: dict, vernamekey: str) -> tuple[list, str, str, str, str]:
+        reterr: tuple[list, str, str, str, str] = ([], '', '', '', '')
+        vername: str = vernamekey
+        if vernamekey == '@LATEST-RELEASE':
+            vername = relindex['latest']
+        d: dict = relindex['releases'].get(vername, dict())
+        if len(d) == 0:
             return reterr
-        rettpl = (urls, osname, status, thedate, vernamekey)
+        rettpl: tuple[list, str, str, str, str] = (
+            d['urls'], d['osname'], d['status'], d['thedate'], vername)
         return rettpl
 
+    @staticmethod
+    def geturlpath_man(rootdic: dict, vernamekey: str) -> tuple[list, str, str, str, str]:
+        mainfunc = Mainfunc
+        relindex: dict = mainfunc.make_releaseindex(rootdic)
+        return mainfunc.lookup_releaseindex(relindex, vernamekey)
+
     @staticmethod
     def iter_rootdic(rootdic: dict):
         vername: str
@@ -156,6 +183,7 @@ class Mainfunc(object):
                 continue
             if d.get('status') != 'release':
                 continue  # Not 'release' status.
+            urls = list()
             if d.get('url') != None:
                 s = d.get('url')
                 if isinstance(s, str) != True:
@@ -185,56 +213,11 @@ class Mainfunc(object):
 
     @staticmethod
     def loadbytes_url(urlpath: str, exception: bool = True) -> bytes:
-        html_content: bytes = b''
-        if exception:
-            try:
-                with urllib.request.urlopen(urlpath) as response:
-                    html_content = response.read()
-            except urllib.error.URLError as e:
-                errmes = 'Error: URL Error. {0}, URL: {1}'.format(e, urlpath)
-                raise MmanStdError(errmes)
-            except urllib.error.HTTPError as e:
-                errmes = 'Error: HTTP Error. {0}, URL: {1}'.format(e, urlpath)
-                raise MmanStdError(errmes)
-            except Exception as e:
-                errmes = 'Error: Runtime Error. {0}, URL: {1}'.format(
-                    e, urlpath)
-                raise MmanStdError(errmes)
-            b: bytes = html_content
-            return b
-        else:
-            try:
-                with urllib.request.urlopen(urlpath) as response:
-                    html_content = response.read()
-            except:
-                pass
-            return html_content
+        return Man_transport.loadbytes(urlpath, exception=exception)
 
     @staticmethod
     def loadstring_url(urlpath: str, exception: bool = True) -> str:
-        html_content: str = ''
-        if exception:
-            try:
-                with urllib.request.urlopen(urlpath) as response:
-                    html_content = response.read().decode("utf-8")
-            except urllib.error.URLError as e:
-                errmes = 'Error: URL Error. {0}, URL: {1}'.format(e, urlpath)
-                raise MmanStdError(errmes)
-            except urllib.error.HTTPError as e:
-                errmes = 'Error: HTTP Error. {0}, URL: {1}'.format(e, urlpath)
-                raise MmanStdError(errmes)
-            except Exception as e:
-                errmes = 'Error: Runtime Error. {0}, URL: {1}'.format(
-                    e, urlpath)
-                raise MmanStdError(errmes)
-        else:
-            try:
-                with urllib.request.urlopen(urlpath) as response:
-                    html_content = response.read().decode("utf-8")
-            except:
-                pass
-        s = html_content
-        return s
+        return Man_transport.loadbytes(urlpath, exception=exception).decode('UTF-8')
 
     @staticmethod
     def normurl(url: str) -> str:
@@ -414,43 +397,275 @@ class Mmanfunc(object):
         return s
 
     @staticmethod
-    def loadstring_url(urlpath: str, exception: bool = True) -> str:
-        if 'cloudfront' in urlpath:
-            time.sleep(3)
-        request = urllib.request.Request(urlpath)
-        request.add_header('x-mman-enable', 'YES')
-        request.add_header('User-Agent', 'mman/0.0.8')
-        print(request.header_items())
-        html_content: str = ''
-        if exception:
-            try:
-                with urllib.request.urlopen(request) as response:
-                    html_content = response.read().decode("utf-8")
-            except urllib.error.URLError as e:
-                errmes = 'Error: URL Error. {0}, URL: {1}'.format(e, urlpath)
-                raise MmanStdError(errmes)
-            except urllib.error.HTTPError as e:
-                errmes = 'Error: HTTP Error. {0}, URL: {1}'.format(e, urlpath)
-                raise MmanStdError(errmes)
-            except Exception as e:
-                errmes = 'Error: Runtime Error. {0}, URL: {1}'.format(
-                    e, urlpath)
-                raise MmanStdError(errmes)
-        else:
-            try:
-                with urllib.request.urlopen(request) as response:
-                    html_content = response.read().decode("utf-8")
-            except:
-                pass
-        print(request.full_url)
-        s = html_content
-        return s
+    def loadstring_url(urlpath: str, exception: bool = True, user_agent: str = '') -> str:
+        headers: dict = {'x-mman-enable': 'YES'}
+        if user_agent != '':
+            headers['user-agent'] = user_agent
+        bys: bytes = Man_transport.loadbytes(
+            urlpath, headers=headers, exception=exception)
+        return bys.decode('UTF-8')
+
+
+class Man_cache_validator(typing.NamedTuple):
+    hashdg: str
+    etag: str
+    lastmodified: str
+
+
+class Man_cachebackend_file(object):
+    name: typing.Final[str] = 'file'
+
+    def __init__(self):
+        self._tmpdir: pathlib.Path = pathlib.Path('.')
+        return
+
+    @property
+    def tmpdir(self) -> pathlib.Path:
+        return self._tmpdir
+
+    def init(self, tmpdir: pathlib.Path):
+        self._tmpdir = tmpdir
+        return
+
+    def _makefpath(self, name: str) -> pathlib.Path:
+        if re.fullmatch(r'[0-9A-Za-z_][0-9A-Za-z_.\-]*', name) == None:
+            errmes: str = 'Error: Invalid cache object name. [{0}]'.format(
+                name)
+            raise MmanStdError(errmes)
+        return self.tmpdir / name
+
+    def read(self, name: str) -> bytes | None:
+        fpath: pathlib.Path = self._makefpath(name)
+        try:
+            with open(fpath, 'rb') as fp:
+                return fp.read()
+        except FileNotFoundError:
+            return None
+        except OSError:
+            errmes: str = 'Error: cache file open error. [{0}]'.format(fpath)
+            raise MmanStdError(errmes)
+
+    def _write_atomic(self, name: str, data: bytes) -> os.stat_result:
+        fpath: pathlib.Path = self._makefpath(name)
+        tmpfpath: pathlib.Path = fpath.with_name(
+            '{0}.{1}.tmp'.format(fpath.name, os.getpid()))
+        with open(tmpfpath, 'wb') as fp:
+            fp.write(data)
+            fp.flush()
+            st: os.stat_result = os.fstat(fp.fileno())
+        os.replace(tmpfpath, fpath)
+        return st
+
+    def write(self, name: str, data: bytes):
+        self._write_atomic(name, data)
+        return
+
+    def _store_fingerprint(self, name: str, st: os.stat_result, hashdg: str):
+        s: str = '{0} {1} {2} {3}\n'.format(
+            st.st_size, st.st_mtime_ns, st.st_ino, hashdg)
+        self._write_atomic(name + '.fingerprint', s.encode('ascii'))
+        return
+
+    def write_verified(self, name: str, data: bytes) -> str:
+        hashdg: str = hashlib.new('SHA3-256', data).hexdigest()
+        st: os.stat_result = self._write_atomic(name, data)
+        self._store_fingerprint(name, st, hashdg)
+        return hashdg
+
+    def read_verified(self, name: str, hashdg: str, paranoid: bool = False) -> bytes | None:
+        fpath: pathlib.Path = self._makefpath(name)
+        fpbys: bytes | None = self.read(name + '.fingerprint')
+        fingerprint: list = list() if fpbys == None else fpbys.decode(
+            'ascii', errors='replace').split()
+        try:
+            with open(fpath, 'rb') as fp:
+                st: os.stat_result = os.fstat(fp.fileno())
+                stamp: list = [str(st.st_size), str(
+                    st.st_mtime_ns), str(st.st_ino)]
+                if paranoid != True and fingerprint[0:3] == stamp:
+                    return fp.read() if fingerprint[3:] == [hashdg] else None
+                data: bytes = fp.read()
+        except FileNotFoundError:
+            return None
+        except OSError:
+            errmes: str = 'Error: cache file open error. [{0}]'.format(fpath)
+            raise MmanStdError(errmes)
+        if hashlib.new('SHA3-256', data).hexdigest() != hashdg:
+            return None
+        if fingerprint[0:3] != stamp:
+            self._store_fingerprint(name, st, hashdg)
+        return data
+
+    def remove(self, name: str):
+        self._makefpath(name).unlink(missing_ok=True)
+        self._makefpath(name + '.fingerprint').unlink(missing_ok=True)
+        return
+
+    def evict(self, maxbytes: int = 0) -> int:
+        return 0
+
+    def stats(self) -> dict:
+        retdict: dict = dict()
+        for f in self.tmpdir.glob('*'):
+            if f.is_file():
+                kind: str = 'page' if f.name.startswith('pages.') else 'meta'
+                n, size = retdict.get(kind, (0, 0))
+                retdict[kind] = (n + 1, size + f.stat().st_size)
+        return retdict
+
+    def close(self):
+        return
+
+
+class Man_cachebackend_sqlite(object):
+    name: typing.Final[str] = 'sqlite'
+    __fname_db: typing.Final[str] = 'cache.sqlite3'
+    __schema: typing.Final[tuple] = (
+        'CREATE TABLE IF NOT EXISTS blobs (kind TEXT NOT NULL, name TEXT NOT NULL, '
+        'data BLOB NOT NULL, size INTEGER NOT NULL, atime REAL NOT NULL, '
+        "digest TEXT NOT NULL DEFAULT '', "
+        'PRIMARY KEY (kind, name))',
+        'CREATE INDEX IF NOT EXISTS blobs_atime ON blobs (atime)')
+    busytimeout: float = 10.0
+    maxbytes: int = 256 * 1024 * 1024
+
+    def __init__(self):
+        self._tmpdir: pathlib.Path = pathlib.Path('.')
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        return
+
+    @property
+    def tmpdir(self) -> pathlib.Path:
+        return self._tmpdir
+
+    @property
+    def fpath(self) -> pathlib.Path:
+        return self.tmpdir / self.__fname_db
+
+    def init(self, tmpdir: pathlib.Path):
+        self.close()
+        self._tmpdir = tmpdir
+        return
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn != None and self._pid == os.getpid():
+            return self._conn
+        try:
+            conn: sqlite3.Connection = sqlite3.connect(
+                str(self.fpath), timeout=self.busytimeout,
+                isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            for sql in self.__schema:
+                conn.execute(sql)
+            self._migrate(conn)
+        except sqlite3.Error as e:
+            errmes: str = 'Error: cache database open error. [{0}] {1}'.format(
+                self.fpath, e)
+            raise MmanStdError(errmes)
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        columns: set = {row[1] for row in conn.execute('PRAGMA table_info(blobs)')}
+        if 'digest' in columns:
+            return
+        try:
+            conn.execute("ALTER TABLE blobs ADD COLUMN digest TEXT NOT NULL DEFAULT ''")
+        except sqlite3.OperationalError:
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(blobs)')}
+            if 'digest' not in columns:
+                raise
+        return
+
+    def _execute(self, sql: str, params: tuple = tuple()) -> sqlite3.Cursor:
+        try:
+            return self._connect().execute(sql, params)
+        except sqlite3.Error as e:
+            errmes: str = 'Error: cache database error. [{0}] {1}'.format(
+                self.fpath, e)
+            raise MmanStdError(errmes)
+
+    def _get(self, kind: str, name: str) -> tuple[bytes | None, str]:
+        sql: str = 'SELECT data, digest FROM blobs WHERE kind = ? AND name = ?'
+        with self._lock:
+            row = self._execute(sql, (kind, name)).fetchone()
+            if row == None:
+                return None, ''
+            self._execute('UPDATE blobs SET atime = ? WHERE kind = ? AND name = ?',
+                          (time.time(), kind, name))
+        return bytes(row[0]), row[1]
+
+    def _put(self, kind: str, name: str, data: bytes, digest: str = ''):
+        sql: str = 'INSERT OR REPLACE INTO blobs (kind, name, data, size, atime, digest) ' \
+            'VALUES (?, ?, ?, ?, ?, ?)'
+        with self._lock:
+            self._execute(sql, (kind, name, data, len(data), time.time(), digest))
+        return
+
+    def read(self, name: str) -> bytes | None:
+        return self._get('meta', name)[0]
+
+    def write(self, name: str, data: bytes):
+        self._put('meta', name, data)
+        return
+
+    def write_verified(self, name: str, data: bytes) -> str:
+        hashdg: str = hashlib.new('SHA3-256', data).hexdigest()
+        self._put('meta', name, data, hashdg)
+        return hashdg
+
+    def read_verified(self, name: str, hashdg: str, paranoid: bool = False) -> bytes | None:
+        data, digest = self._get('meta', name)
+        if data == None or digest != hashdg:
+            return None
+        if paranoid and hashlib.new('SHA3-256', data).hexdigest() != hashdg:
+            return None
+        return data
+
+    def remove(self, name: str):
+        with self._lock:
+            self._execute('DELETE FROM blobs WHERE kind = ? AND name = ?', ('meta', name))
+        return
+
+    def get_page(self, hashdg: str) -> bytes | None:
+        return self._get('page', hashdg)[0]
+
+    def put_page(self, hashdg: str, data: bytes):
+        self._put('page', hashdg, data, hashdg)
+        return
+
+    def evict(self, maxbytes: int = 0) -> int:
+        maxbytes = self.maxbytes if maxbytes <= 0 else maxbytes
+        sql: str = 'DELETE FROM blobs WHERE rowid IN (SELECT rowid FROM (' \
+            'SELECT rowid, SUM(size) OVER (ORDER BY atime DESC, rowid DESC) AS total ' \
+            'FROM blobs) WHERE total > ?)'
+        with self._lock:
+            cur = self._execute(sql, (maxbytes,))
+        return cur.rowcount
+
+    def stats(self) -> dict:
+        sql: str = 'SELECT kind, COUNT(*), SUM(size) FROM blobs GROUP BY kind'
+        with self._lock:
+            rows: list = self._execute(sql).fetchall()
+        return {kind: (n, size) for kind, n, size in rows}
+
+    def close(self):
+        if self._conn != None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+        return
 
 
 class Man_cache(object):
     _suffix_cmdnames: typing.Final[dict] = \
         {('fb', 'eng', 'arm64'): 'enfb', ('fb', 'jpn', 'arm64'): 'jpfb',
          ('ob', 'eng', 'arm64'): 'enob'}
+    paranoid: bool = False
 
     def __init__(self):
         self._og_os2: str = ''
@@ -463,8 +678,13 @@ class Man_cache(object):
         self._tmpdir: pathlib.Path = pathlib.Path('')
         self._rooturlsfpath: pathlib.Path = pathlib.Path('')
         self._md5b32ten: str = ''
+        self._backend: Man_cachebackend_file | Man_cachebackend_sqlite = Man_cachebackend_file()
         return
 
+    @property
+    def backend(self) -> 'Man_cachebackend_file | Man_cachebackend_sqlite':
+        return self._backend
+
     @property
     def og_os2(self):
         return self._og_os2
@@ -564,6 +784,21 @@ class Man_cache(object):
         tmpdir = tmpdir_system / s
         return tmpdir
 
+    def _makefpath_persistdir(self) -> pathlib.Path:
+        if len(self.md5b32ten) != 10:
+            errmes: str = 'Error: Not initialize, Not found md5b32ten.'
+            raise ValueError(errmes)
+        s: str = 'mman_{0}'.format(self.md5b32ten)
+        if sys.platform != 'win32':
+            s = 'mman_{0}_{1}'.format(os.getuid(), self.md5b32ten)
+        return pathlib.Path(tempfile.gettempdir()) / s
+
+    @property
+    def persistdir(self) -> pathlib.Path:
+        persistdir: typing.Final[pathlib.Path] = self._makefpath_persistdir()
+        persistdir.mkdir(mode=0o700, exist_ok=True)
+        return persistdir
+
     def init(self, os2: str, lang: str, arch: str, cmdver: str, cmddate: str):
         errmes: str = ''
         t: tuple = (os2, lang, arch)
@@ -579,6 +814,7 @@ class Man_cache(object):
             os2, lang, arch, cmdver, cmddate)
         self._tmpdir = self._makefpath_tmpdir()
         self._rooturlsfpath = self.tmpdir / 'rooturls.txt'
+        self._backend.init(self.tmpdir)
         return
 
     def mktempdir_ifnot(self):
@@ -591,6 +827,20 @@ class Man_cache(object):
             newstmode = os.stat(dpath).st_mode | 0o1000
             os.chmod(dpath, newstmode)
         self._tmpdir = tmpdir
+        self._backend.init(tmpdir)
+        return
+
+    def set_backend(self, name: str):
+        backends: typing.Final[dict] = {'file': Man_cachebackend_file,
+                                        'sqlite': Man_cachebackend_sqlite}
+        if name not in backends:
+            errmes: str = 'Error: Unknown cache backend. [{0}]'.format(name)
+            raise MmanStdError(errmes)
+        if name == self._backend.name:
+            return
+        self._backend.close()
+        self._backend = backends[name]()
+        self._backend.init(self.tmpdir)
         return
 
     def remove_oldcache(self):
@@ -629,6 +879,11 @@ class Man_cache(object):
             if nowepoch - epoch < ttl:
                 continue
             shutil.rmtree(f)
+        if nowtmpdir.is_dir():
+            pcache = Man_pagercache()
+            pcache.init(nowtmpdir, self.backend)
+            pcache.compact()
+            self.backend.evict()
         return
 
     def store_roottoml(self, hit: bool, gzbys: bytes):
@@ -641,10 +896,7 @@ class Man_cache(object):
                 errmes = 'Error: {0} is NOT {1} type'.format(
                     vname, repr(vtype))
                 raise TypeError(errmes)
-        fpath: pathlib.PosixPath | pathlib.WindowsPath
-        fpath = self.tmpdir / 'root.toml.gz'
-        with open(str(fpath), 'wb') as fp:
-            fp.write(gzbys)
+        self.backend.write_verified('root.toml.gz', gzbys)
         return
 
     def get_roottoml(self, hashdg: str) -> tuple[bool, str]:
@@ -657,21 +909,9 @@ class Man_cache(object):
             errmes = 'Error: Not found cache directory. [{0}]'.format(
                 self.tmpdir)
             raise MmanStdError(errmes)
-        fpath: pathlib.PosixPath | pathlib.WindowsPath
-        fpath = self.tmpdir / 'root.toml.gz'
-        if fpath.is_file() != True:
-            return False, ''
-        hobj: typing.Final = hashlib.new('SHA3-256')
-        try:
-            with open(fpath, 'rb') as fp:
-                gzbys: typing.Final[bytes] = fp.read()
-        except:
-            errmes = 'Error: root.toml.gz cache file open error. [{0}]'.format(
-                fpath)
-            raise MmanStdError(errmes)
-        hobj.update(gzbys)
-        hashdg_body: str = hobj.hexdigest()
-        if hashdg_body != hashdg:
+        gzbys: typing.Final[bytes | None] = self.backend.read_verified(
+            'root.toml.gz', hashdg, self.paranoid)
+        if gzbys == None:
             return False, ''
         rootbys: bytes = gzip.decompress(gzbys)
         rootstr: str = rootbys.decode('UTF-8')
@@ -697,10 +937,7 @@ class Man_cache(object):
         if re.match(ptn, fname) == None:
             errmes = 'Error: Not man.toml.gz format. [{0}]'.format(fname)
             raise MmanStdError(errmes)
-        fpath: pathlib.PosixPath | pathlib.WindowsPath
-        fpath = self.tmpdir / fname
-        with open(str(fpath), 'wb') as fp:
-            fp.write(gzbys)
+        self.backend.write_verified(fname, gzbys)
         return
 
     def get_mantoml(self, url: str, hashdg: str) -> tuple[bool, str]:
@@ -722,25 +959,260 @@ class Man_cache(object):
         if re.match(ptn, fname) == None:
             errmes = 'Error: Not man.toml.gz format. [{0}]'.format(fname)
             raise MmanStdError(errmes)
-        fpath: pathlib.PosixPath | pathlib.WindowsPath
-        fpath = self.tmpdir / fname
-        if fpath.is_file() != True:
+        gzbys: typing.Final[bytes | None] = self.backend.read_verified(
+            fname, hashdg, self.paranoid)
+        if gzbys == None:
             return False, ''
-        hobj: typing.Final = hashlib.new('SHA3-256')
+        mantomlbys: bytes = gzip.decompress(gzbys)
+        mantomlstr: str = mantomlbys.decode('UTF-8')
+        return True, mantomlstr
+
+    def _makename_validator(self, fname: str) -> str:
+        ptn_root: str = r'root\.toml\.gz'
+        ptn_man: str = r'man.+(?:amd64|arm64)_hash_2[0-9]{3}[0-1][0-9][0-3][0-9]\.toml\.gz'
+        if re.fullmatch(ptn_root, fname) == None and re.fullmatch(ptn_man, fname) == None:
+            errmes: str = 'Error: Not toml.gz cache file name. [{0}]'.format(
+                fname)
+            raise MmanStdError(errmes)
+        return fname + '.validator'
+
+    def store_validator(self, fname: str, hashdg: str, etag: str, lastmodified: str):
+        errmes: str = ''
+        chklist: list = [(fname, 'fname'), (hashdg, 'hashdg'),
+                         (etag, 'etag'), (lastmodified, 'lastmodified')]
+        for v, vname in chklist:
+            if isinstance(v, str) != True:
+                errmes = 'Error: {0} is NOT string type.'.format(vname)
+                raise TypeError(errmes)
+        ptn: str = r'[0-9a-f]{64}'
+        if re.fullmatch(ptn, hashdg) == None:
+            errmes = 'Error: Not hashdg string. [{0}]'.format(hashdg)
+            raise MmanStdError(errmes)
+        name: str = self._makename_validator(fname)
+        if etag == '' and lastmodified == '':
+            self.backend.remove(name)
+            return
+        rows: list = ['hashdg: {0}'.format(hashdg),
+                      'etag: {0}'.format(etag),
+                      'last-modified: {0}'.format(lastmodified)]
+        s: str = ''.join([row + '\n' for row in rows])
+        self.backend.write(name, s.encode('UTF-8'))
+        return
+
+    def get_validator(self, fname: str) -> Man_cache_validator:
+        retempty: typing.Final[Man_cache_validator] = Man_cache_validator(
+            hashdg='', etag='', lastmodified='')
+        bys: bytes | None = self.backend.read(self._makename_validator(fname))
+        if bys == None:
+            return retempty
+        d: dict = dict()
+        try:
+            for row in bys.decode('UTF-8').splitlines():
+                k, sep, v = row.partition(': ')
+                if sep != '':
+                    d[k] = v
+        except UnicodeDecodeError:
+            return retempty
+        hashdg: str = d.get('hashdg', '')
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            return retempty
+        retobj: Man_cache_validator = Man_cache_validator(
+            hashdg=hashdg, etag=d.get('etag', ''),
+            lastmodified=d.get('last-modified', ''))
+        return retobj
+
+    @staticmethod
+    def _write_atomic(fpath: pathlib.Path, data: bytes):
+        tmpfpath: pathlib.Path = fpath.with_name(
+            '{0}.{1}.tmp'.format(fpath.name, os.getpid()))
+        with open(tmpfpath, 'wb') as fp:
+            fp.write(data)
+        os.replace(tmpfpath, fpath)
+        return
+
+    def _makefpath_index(self, kind: str, hashdg: str) -> pathlib.Path:
+        errmes: str = ''
+        if re.fullmatch(r'[a-z0-9]+', kind) == None:
+            errmes = 'Error: Invalid index kind. [{0}]'.format(kind)
+            raise MmanStdError(errmes)
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            errmes = 'Error: Not hashdg string. [{0}]'.format(hashdg)
+            raise MmanStdError(errmes)
+        fpath: pathlib.Path = self.tmpdir / \
+            'index_{0}_{1}.json'.format(kind, hashdg)
+        return fpath
+
+    def store_index(self, kind: str, hashdg: str, obj: dict | list):
+        if isinstance(obj, dict) != True and isinstance(obj, list) != True:
+            errmes: str = 'Error: index object is NOT dict or list type.'
+            raise TypeError(errmes)
+        fpath: pathlib.Path = self._makefpath_index(kind, hashdg)
+        s: str = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+        self._write_atomic(fpath, s.encode('UTF-8'))
+        return
+
+    def get_index(self, kind: str, hashdg: str) -> tuple[bool, dict | list]:
+        fpath: pathlib.Path = self._makefpath_index(kind, hashdg)
+        if fpath.is_file() != True:
+            return False, dict()
         try:
             with open(fpath, 'rb') as fp:
-                gzbys: typing.Final[bytes] = fp.read()
+                obj: dict | list = json.loads(fp.read().decode('UTF-8'))
         except:
-            errmes = 'Error: man.toml.gz cache file open error. [{0}]'.format(
-                fpath)
+            return False, dict()
+        return True, obj
+
+    def _makefpath_listman(self, hashdg: str, section: str) -> pathlib.Path:
+        errmes: str = ''
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            errmes = 'Error: Not hashdg string. [{0}]'.format(hashdg)
+            raise MmanStdError(errmes)
+        if section not in ('all', '1', '2', '3', '4', '5', '6', '7', '8', '9'):
+            errmes = 'Error: Invalid listman section. [{0}]'.format(section)
+            raise MmanStdError(errmes)
+        fpath: pathlib.Path = self.tmpdir / \
+            'listman_{0}'.format(hashdg) / '{0}.txt'.format(section)
+        return fpath
+
+    def store_listman(self, hashdg: str, listman: dict):
+        section: str
+        names: list
+        for section, names in listman.items():
+            fpath: pathlib.Path = self._makefpath_listman(hashdg, section)
+            fpath.parent.mkdir(exist_ok=True)
+            s: str = ''.join([name + '\n' for name in names])
+            self._write_atomic(fpath, s.encode('UTF-8'))
+        return
+
+    def get_listman(self, hashdg: str, section: str) -> tuple[bool, pathlib.Path]:
+        fpath: pathlib.Path = self._makefpath_listman(hashdg, section)
+        return fpath.is_file(), fpath
+
+    def store_mantoml_last(self, hashdg: str):
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            errmes: str = 'Error: Not hashdg string. [{0}]'.format(hashdg)
+            raise MmanStdError(errmes)
+        self.backend.write('mantoml_last.txt', (hashdg + '\n').encode('UTF-8'))
+        return
+
+    def get_mantoml_last(self) -> str:
+        bys: bytes | None = self.backend.read('mantoml_last.txt')
+        if bys == None:
+            return ''
+        hashdg: str = bys.decode('UTF-8', errors='replace').strip()
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            return ''
+        return hashdg
+
+    def store_mantoml_base(self, hashdg: str, tomldic: dict):
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            errmes: str = 'Error: Not hashdg string. [{0}]'.format(hashdg)
+            raise MmanStdError(errmes)
+        fpath: typing.Final[pathlib.Path] = self.persistdir / 'mantoml_base.json'
+        s: str = json.dumps({'hashdg': hashdg, 'tomldic': tomldic},
+                            ensure_ascii=False, separators=(',', ':'))
+        self._write_atomic(fpath, s.encode('UTF-8'))
+        return
+
+    def get_mantoml_base(self) -> tuple[str, dict]:
+        fpath: typing.Final[pathlib.Path] = self.persistdir / 'mantoml_base.json'
+        try:
+            with open(fpath, 'rb') as fp:
+                obj: dict = json.loads(fp.read().decode('UTF-8'))
+        except (OSError, UnicodeDecodeError, ValueError):
+            return '', dict()
+        hashdg: str = obj.get('hashdg', '') if isinstance(obj, dict) else ''
+        tomldic: dict = obj.get('tomldic', dict()) if isinstance(obj, dict) else dict()
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None or isinstance(tomldic, dict) != True:
+            return '', dict()
+        return hashdg, tomldic
+
+    def store_bloom_latest(self, hashdg: str, bloom: 'Man_bloomfilter'):
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            errmes: str = 'Error: Not hashdg string. [{0}]'.format(hashdg)
+            raise MmanStdError(errmes)
+        fpath: pathlib.Path = self.tmpdir / 'bloom_latest.bin'
+        self._write_atomic(fpath, hashdg.encode('ascii') + bloom.to_bytes())
+        return
+
+    def get_bloom_latest(self) -> tuple[str, 'Man_bloomfilter | None']:
+        fpath: pathlib.Path = self.tmpdir / 'bloom_latest.bin'
+        try:
+            with open(fpath, 'rb') as fp:
+                bys: bytes = fp.read()
+            hashdg: str = bys[:64].decode('ascii')
+            bloom: Man_bloomfilter = Man_bloomfilter.from_bytes(bys[64:])
+        except (OSError, ValueError, struct.error):
+            return '', None
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            return '', None
+        return hashdg, bloom
+
+    def _makename_render(self, hashdg: str, normform: str, version: int) -> str:
+        errmes: str = ''
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            errmes = 'Error: Not hashdg string. [{0}]'.format(hashdg)
             raise MmanStdError(errmes)
-        hobj.update(gzbys)
-        hashdg_body: str = hobj.hexdigest()
-        if hashdg_body != hashdg:
+        if normform not in ('NFC', 'NFD', 'none'):
+            errmes = 'Error: Invalid normalization form. [{0}]'.format(
+                normform)
+            raise MmanStdError(errmes)
+        return 'render_{0}_{1}_v{2}.txt'.format(hashdg, normform, int(version))
+
+    def _hottier(self) -> 'Man_hottier':
+        hottier: Man_hottier = Man_hottier()
+        hottier.init(self.tmpdir)
+        return hottier
+
+    def store_render(self, hashdg: str, normform: str, version: int, rendered: str):
+        name: str = self._makename_render(hashdg, normform, version)
+        if self.backend.name != 'file':
+            self.backend.write(name, rendered.encode('UTF-8'))
+        hottier: Man_hottier = self._hottier()
+        if hottier.touch(name[:-4]) >= Man_hottier.promote_hits:
+            hottier.offer(name[:-4], rendered)
+        return
+
+    def get_render_fpath(self, hashdg: str, normform: str, version: int) -> pathlib.Path | None:
+        name: str = self._makename_render(hashdg, normform, version)
+        return self._hottier().get_fpath(name[:-4])
+
+    def get_render(self, hashdg: str, normform: str, version: int) -> tuple[bool, str]:
+        name: str = self._makename_render(hashdg, normform, version)
+        hottier: Man_hottier = self._hottier()
+        hotstr: str | None = hottier.get(name[:-4])
+        if hotstr != None:
+            return True, hotstr
+        if self.backend.name == 'file':
             return False, ''
-        mantomlbys: bytes = gzip.decompress(gzbys)
-        mantomlstr: str = mantomlbys.decode('UTF-8')
-        return True, mantomlstr
+        bys: bytes | None = self.backend.read(name)
+        if bys == None:
+            return False, ''
+        try:
+            s: str = bys.decode('UTF-8')
+        except UnicodeDecodeError:
+            return False, ''
+        if hottier.touch(name[:-4]) >= Man_hottier.promote_hits:
+            hottier.offer(name[:-4], s)
+        return True, s
+
+    def store_complete(self, cmdname: str, names: list):
+        if re.fullmatch(r'man[a-z]{4}', cmdname) == None:
+            errmes: str = 'Error: Invalid command name. [{0}]'.format(cmdname)
+            raise MmanStdError(errmes)
+        fpath: pathlib.Path = self.tmpdir / 'complete_{0}.txt'.format(cmdname)
+        s: str = ''.join([name + '\n' for name in sorted(names)])
+        self._write_atomic(fpath, s.encode('UTF-8'))
+        return
+
+    def store_nomanifest(self):
+        fpath: pathlib.Path = self.tmpdir / 'CHECKSUM.SHA3-256.absent'
+        fpath.touch()
+        return
+
+    def get_nomanifest(self) -> bool:
+        fpath: pathlib.Path = self.tmpdir / 'CHECKSUM.SHA3-256.absent'
+        return fpath.is_file()
 
     def store_rooturls(self, rooturls: tuple):
         if len(rooturls) == 0:
@@ -765,32 +1237,339 @@ class Man_cache(object):
         return tuple(tmplist)
 
 
-class Man_pagercache(object):
+class Man_bloomfilter(object):
+    __magic: typing.Final[bytes] = b'MMBF'
+    __header: typing.Final[struct.Struct] = struct.Struct('>4sII')
+
     def __init__(self):
-        self._tmpdir: pathlib.Path = pathlib.Path('.')
+        self._nbits: int = 8
+        self._nhash: int = 1
+        self._bits: bytearray = bytearray(1)
         return
 
     @property
-    def tmpdir(self):
-        return self._tmpdir
+    def nbits(self) -> int:
+        return self._nbits
 
-    def init(self, tmpdir: pathlib.Path):
-        errmes = ''
-        if isinstance(tmpdir, pathlib.PosixPath) != True and isinstance(tmpdir, pathlib.WindowsPath) != True:
-            errmes = 'Error: tmpdir is NOT PosixPath or WindowsPath object.'
+    @property
+    def nhash(self) -> int:
+        return self._nhash
+
+    def init(self, nkeys: int, fprate: float = 0.001):
+        errmes: str = ''
+        if isinstance(nkeys, int) != True or nkeys < 0:
+            errmes = 'Error: nkeys is NOT positive int.'
+            raise ValueError(errmes)
+        if isinstance(fprate, float) != True or (0.0 < fprate < 1.0) != True:
+            errmes = 'Error: fprate is NOT float between 0 and 1.'
+            raise ValueError(errmes)
+        nbits: int = int(-max(nkeys, 1) * math.log(fprate) / (math.log(2) ** 2))
+        nbits = max(64, (nbits + 7) // 8 * 8)
+        self._nbits = nbits
+        self._nhash = max(1, round(nbits / max(nkeys, 1) * math.log(2)))
+        self._bits = bytearray(nbits // 8)
+        return
+
+    def _positions(self, key: str) -> typing.Iterator[int]:
+        dg: bytes = hashlib.blake2b(key.encode('UTF-8'), digest_size=16).digest()
+        h1: int = int.from_bytes(dg[:8], 'little')
+        h2: int = int.from_bytes(dg[8:], 'little') | 1
+        return ((h1 + i * h2) % self._nbits for i in range(self._nhash))
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        return
+
+    def __contains__(self, key: str) -> bool:
+        for pos in self._positions(key):
+            if self._bits[pos >> 3] & (1 << (pos & 7)) == 0:
+                return False
+        return True
+
+    def to_bytes(self) -> bytes:
+        return self.__header.pack(self.__magic, self._nbits, self._nhash) + bytes(self._bits)
+
+    @staticmethod
+    def from_bytes(bys: bytes) -> 'Man_bloomfilter':
+        header: struct.Struct = Man_bloomfilter.__header
+        magic, nbits, nhash = header.unpack_from(bys)
+        bits: bytes = bys[header.size:]
+        if magic != Man_bloomfilter.__magic or nbits != len(bits) * 8 or nhash == 0:
+            errmes: str = 'Error: Invalid bloom filter data.'
+            raise ValueError(errmes)
+        bloom = Man_bloomfilter()
+        bloom._nbits = nbits
+        bloom._nhash = nhash
+        bloom._bits = bytearray(bits)
+        return bloom
+
+
+class Man_bktree(object):
+    def __init__(self):
+        self._root: list = list()
+        self._size: int = 0
+        return
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _makepeq(word: str) -> dict:
+        peq: dict = dict()
+        for i, c in enumerate(word):
+            peq[c] = peq.get(c, 0) | (1 << i)
+        return peq
+
+    @staticmethod
+    def _distance(peq: dict, m: int, word: str) -> int:
+        if m == 0:
+            return len(word)
+        mask: int = (1 << m) - 1
+        high: int = 1 << (m - 1)
+        pv: int = mask
+        mv: int = 0
+        dist: int = m
+        for c in word:
+            eq: int = peq.get(c, 0)
+            xv: int = eq | mv
+            xh: int = (((eq & pv) + pv) ^ pv) | eq
+            ph: int = mv | (~(xh | pv) & mask)
+            mh: int = pv & xh
+            if ph & high:
+                dist += 1
+            elif mh & high:
+                dist -= 1
+            ph = ((ph << 1) | 1) & mask
+            mh = (mh << 1) & mask
+            pv = mh | (~(xv | ph) & mask)
+            mv = ph & xv
+        return dist
+
+    @staticmethod
+    def distance(word1: str, word2: str) -> int:
+        return Man_bktree._distance(Man_bktree._makepeq(word1), len(word1), word2)
+
+    def init(self, words: list | tuple):
+        if isinstance(words, list) != True and isinstance(words, tuple) != True:
+            errmes: str = 'Error: words is NOT list or tuple type.'
             raise TypeError(errmes)
-        self._tmpdir = tmpdir
+        self._root = list()
+        self._size = 0
+        for word in sorted(set(words)):
+            self.add(word)
         return
 
-    def get_pager(self, url: str) -> tuple[bool, str]:
-        errmes: str = ''
-        if isinstance(url, str) != True:
-            errmes = 'Error: url is not string type.'
-            raise MmanStdError(errmes)
-        if self.tmpdir.is_dir() != True:
-            errmes = 'Error: Not found cache directory. [{0}]'.format(
-                self.tmpdir)
+    def add(self, word: str):
+        if len(self._root) == 0:
+            self._root = [word, dict()]
+            self._size = 1
+            return
+        node: list = self._root
+        while True:
+            dist: int = self.distance(word, node[0])
+            if dist == 0:
+                return
+            child: list | None = node[1].get(dist)
+            if child == None:
+                node[1][dist] = [word, dict()]
+                self._size += 1
+                return
+            node = child
+
+    def search(self, word: str, maxdist: int, limit: int = 5) -> list:
+        if len(self._root) == 0:
+            return list()
+        peq: dict = self._makepeq(word)
+        m: int = len(word)
+        hits: list = list()
+        stack: list = [self._root]
+        while len(stack) >= 1:
+            node: list = stack.pop()
+            dist: int = self._distance(peq, m, node[0])
+            if dist <= maxdist:
+                hits.append((dist, node[0]))
+            for d, child in node[1].items():
+                if dist - maxdist <= d <= dist + maxdist:
+                    stack.append(child)
+        hits.sort()
+        return [w for d, w in hits[:limit]] if limit >= 1 else [w for d, w in hits]
+
+    def to_obj(self) -> list:
+        def inloop(node: list) -> list:
+            return [node[0], [[d, inloop(child)] for d, child in node[1].items()]]
+        if len(self._root) == 0:
+            return list()
+        return inloop(self._root)
+
+    @staticmethod
+    def from_obj(obj: list) -> 'Man_bktree':
+        bktree = Man_bktree()
+
+        def inloop(node: list) -> list:
+            bktree._size += 1
+            return [node[0], {d: inloop(child) for d, child in node[1]}]
+        if len(obj) == 2:
+            bktree._root = inloop(obj)
+        return bktree
+
+
+class Man_hottier(object):
+    __dname: typing.Final[str] = 'hot'
+    __fname_counts: typing.Final[str] = 'counts.json'
+    maxbytes: int = 32 * 1024 * 1024
+    promote_hits: int = 2
+
+    def __init__(self):
+        self._tmpdir: pathlib.Path = pathlib.Path('.')
+        self._counts: dict | None = None
+        return
+
+    @property
+    def hotdir(self) -> pathlib.Path:
+        return self._tmpdir / self.__dname
+
+    def init(self, tmpdir: pathlib.Path):
+        self._tmpdir = tmpdir
+        self._counts = None
+        return
+
+    def _makefpath(self, key: str) -> pathlib.Path:
+        if re.fullmatch(r'[0-9A-Za-z_.\-]+', key) == None:
+            errmes: str = 'Error: Invalid hot tier key. [{0}]'.format(key)
             raise MmanStdError(errmes)
+        return self.hotdir / (key + '.txt')
+
+    def _load_counts(self) -> dict:
+        if self._counts != None:
+            return self._counts
+        try:
+            with open(self.hotdir / self.__fname_counts, 'rb') as fp:
+                self._counts = json.loads(fp.read().decode('UTF-8'))
+        except (OSError, ValueError):
+            self._counts = dict()
+        return self._counts
+
+    def _store_counts(self):
+        fpath: pathlib.Path = self.hotdir / self.__fname_counts
+        tmpfpath: pathlib.Path = fpath.with_name(
+            '{0}.{1}.tmp'.format(fpath.name, os.getpid()))
+        self.hotdir.mkdir(exist_ok=True)
+        with open(tmpfpath, 'wb') as fp:
+            fp.write(json.dumps(self._load_counts(),
+                     separators=(',', ':')).encode('UTF-8'))
+        os.replace(tmpfpath, fpath)
+        return
+
+    def touch(self, key: str) -> int:
+        counts: dict = self._load_counts()
+        n: int = counts.get(key, 0)
+        if n >= self.promote_hits and random.random() >= 0.5 ** (n - self.promote_hits):
+            return n
+        counts[key] = n + 1
+        self._store_counts()
+        return counts[key]
+
+    def get_fpath(self, key: str) -> pathlib.Path | None:
+        fpath: pathlib.Path = self._makefpath(key)
+        if fpath.is_file() != True:
+            return None
+        self.touch(key)
+        return fpath
+
+    def get(self, key: str) -> str | None:
+        fpath: pathlib.Path = self._makefpath(key)
+        try:
+            with open(fpath, 'rb') as fp:
+                if os.fstat(fp.fileno()).st_size == 0:
+                    s: str = ''
+                else:
+                    with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        s = str(mm, 'UTF-8')
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            return None
+        self.touch(key)
+        return s
+
+    def offer(self, key: str, text: str) -> bool:
+        fpath: pathlib.Path = self._makefpath(key)
+        if self._load_counts().get(key, 0) < self.promote_hits:
+            return False
+        bys: bytes = text.encode('UTF-8')
+        if len(bys) > self.maxbytes:
+            return False
+        self.hotdir.mkdir(exist_ok=True)
+        tmpfpath: pathlib.Path = fpath.with_name(
+            '{0}.{1}.tmp'.format(fpath.name, os.getpid()))
+        with open(tmpfpath, 'wb') as fp:
+            fp.write(bys)
+        os.replace(tmpfpath, fpath)
+        self.demote()
+        return True
+
+    def demote(self, maxbytes: int = -1):
+        maxbytes = self.maxbytes if maxbytes < 0 else maxbytes
+        counts: dict = self._load_counts()
+        entries: list = list()
+        total: int = 0
+        for f in self.hotdir.glob('*.txt'):
+            try:
+                st: os.stat_result = f.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((counts.get(f.name[:-4], 0), st.st_mtime, st.st_size, f))
+            total += st.st_size
+        entries.sort(key=lambda x: (x[0], x[1]))
+        for count, mtime, size, f in entries:
+            if total <= maxbytes:
+                break
+            f.unlink(missing_ok=True)
+            total -= size
+        return
+
+
+class Man_pagercache(object):
+    __fname_pack: typing.Final[str] = 'pages.pack'
+    __fname_idx: typing.Final[str] = 'pages.idx'
+    __fname_lock: typing.Final[str] = 'pages.lock'
+    __idx_magic: typing.Final[bytes] = b'MMPX'
+    __idx_header: typing.Final[struct.Struct] = struct.Struct('>4sI')
+    __idx_record: typing.Final[struct.Struct] = struct.Struct('>32sQI')
+    compact_threshold: int = 64
+
+    def __init__(self):
+        self._tmpdir: pathlib.Path = pathlib.Path('.')
+        self._backend: Man_cachebackend_file | Man_cachebackend_sqlite | None = None
+        return
+
+    @property
+    def tmpdir(self):
+        return self._tmpdir
+
+    def init(self, tmpdir: pathlib.Path, backend: 'Man_cachebackend_file | Man_cachebackend_sqlite | None' = None):
+        errmes = ''
+        if isinstance(tmpdir, pathlib.PosixPath) != True and isinstance(tmpdir, pathlib.WindowsPath) != True:
+            errmes = 'Error: tmpdir is NOT PosixPath or WindowsPath object.'
+            raise TypeError(errmes)
+        self._tmpdir = tmpdir
+        self._backend = backend
+        return
+
+    def _isfilebackend(self) -> bool:
+        return self._backend == None or self._backend.name == 'file'
+
+    def _lock(self, exclusive: bool):
+        fp = open(self.tmpdir / self.__fname_lock, 'ab')
+        if sys.platform != 'win32':
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return fp
+
+    @staticmethod
+    def _splitpagerurl(url: str) -> tuple[str, str]:
+        errmes: str = ''
         splitted: list = url.rsplit('/', 2)
         if len(splitted) != 3:
             errmes = 'Error: Not url format. [{0}]'.format(url)
@@ -805,26 +1584,110 @@ class Man_pagercache(object):
         if re.match(ptn, fname) == None:
             errmes = 'Error: Not pager file format. [{0}]'.format(fname)
             raise MmanStdError(errmes)
-        fpath: pathlib.PosixPath | pathlib.WindowsPath
-        fpath = self.tmpdir / fname
-        if fpath.is_file() != True:
-            return False, ''
-        hobj: typing.Final = hashlib.new('SHA3-256')
+        return hashdg, fname
+
+    def _read_idx(self) -> tuple[int, list]:
+        fpath: pathlib.Path = self.tmpdir / self.__fname_idx
         try:
             with open(fpath, 'rb') as fp:
-                gzbys: typing.Final[bytes] = fp.read()
-        except:
-            errmes = 'Error: man.toml.gz cache file open error. [{0}]'.format(
-                fpath)
+                bys: bytes = fp.read()
+        except FileNotFoundError:
+            return 0, list()
+        size: int = self.__idx_record.size
+        magic, nsorted = self.__idx_header.unpack_from(bys, 0)
+        if magic != self.__idx_magic:
+            errmes: str = 'Error: Broken pager index. [{0}]'.format(fpath)
             raise MmanStdError(errmes)
-        hobj.update(gzbys)
-        hashdg_body: str = hobj.hexdigest()
-        if hashdg_body != hashdg:
+        start: int = self.__idx_header.size
+        records: list = [self.__idx_record.unpack_from(bys, pos)
+                         for pos in range(start, len(bys) - size + 1, size)]
+        return nsorted, records
+
+    def _lookup(self, key: bytes) -> tuple[int, int]:
+        fpath: pathlib.Path = self.tmpdir / self.__fname_idx
+        with open(fpath, 'rb') as fp:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hsize: int = self.__idx_header.size
+                rsize: int = self.__idx_record.size
+                magic, nsorted = self.__idx_header.unpack_from(mm, 0)
+                if magic != self.__idx_magic:
+                    errmes: str = 'Error: Broken pager index. [{0}]'.format(
+                        fpath)
+                    raise MmanStdError(errmes)
+                nrecords: int = (len(mm) - hsize) // rsize
+                for i in range(nrecords - 1, nsorted - 1, -1):
+                    k, offset, length = self.__idx_record.unpack_from(
+                        mm, hsize + i * rsize)
+                    if k == key:
+                        return offset, length
+                lo: int = 0
+                hi: int = nsorted
+                while lo < hi:
+                    mid: int = (lo + hi) // 2
+                    pos: int = hsize + mid * rsize
+                    if mm[pos:pos + 32] < key:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                if lo < nsorted:
+                    k, offset, length = self.__idx_record.unpack_from(
+                        mm, hsize + lo * rsize)
+                    if k == key:
+                        return offset, length
+        return -1, 0
+
+    def _readpage(self, hashdg: str) -> bytes | None:
+        errmes: str = ''
+        if self._isfilebackend() != True:
+            return self._backend.get_page(hashdg)
+        if (self.tmpdir / self.__fname_idx).is_file() != True:
+            return None
+        with self._lock(False):
+            offset, length = self._lookup(bytes.fromhex(hashdg))
+            if offset < 0:
+                return None
+            fpath: pathlib.Path = self.tmpdir / self.__fname_pack
+            try:
+                with open(fpath, 'rb') as fp:
+                    with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return mm[offset:offset + length]
+            except (OSError, ValueError):
+                errmes = 'Error: pager pack file open error. [{0}]'.format(
+                    fpath)
+                raise MmanStdError(errmes)
+
+    def get_pager(self, url: str) -> tuple[bool, str]:
+        errmes: str = ''
+        if isinstance(url, str) != True:
+            errmes = 'Error: url is not string type.'
+            raise MmanStdError(errmes)
+        if self.tmpdir.is_dir() != True:
+            errmes = 'Error: Not found cache directory. [{0}]'.format(
+                self.tmpdir)
+            raise MmanStdError(errmes)
+        hashdg, fname = self._splitpagerurl(url)
+        gzbys: typing.Final[bytes | None] = self.get_pagergz(url)
+        if gzbys == None:
+            return False, ''
+        try:
+            mantomlbys: bytes = gzip.decompress(gzbys)
+        except (OSError, EOFError, zlib.error):
             return False, ''
-        mantomlbys: bytes = gzip.decompress(gzbys)
         mantomlstr: str = mantomlbys.decode('UTF-8')
         return True, mantomlstr
 
+    def get_pagergz(self, url: str) -> bytes | None:
+        hashdg, fname = self._splitpagerurl(url)
+        gzbys: typing.Final[bytes | None] = self._readpage(hashdg)
+        if gzbys == None:
+            return None
+        if Man_cache.paranoid:
+            hobj: typing.Final = hashlib.new('SHA3-256')
+            hobj.update(gzbys)
+            if hobj.hexdigest() != hashdg:
+                return None
+        return gzbys
+
     def store_pager(self, hit: bool, pagerurl: str, gzbys: bytes):
         if hit:
             return
@@ -836,37 +1699,992 @@ class Man_pagercache(object):
                 errmes = 'Error: {0} is NOT {1} type'.format(
                     vname, repr(vtype))
                 raise TypeError(errmes)
-        splitted: list = pagerurl.rsplit('/', 1)
-        if len(splitted) != 2:
-            errmes = 'Error: Not pagerurl format. [{0}]'.format(pagerurl)
+        hashdg, fname = self._splitpagerurl(pagerurl)
+        if hashlib.new('SHA3-256', gzbys).hexdigest() != hashdg:
+            return
+        if self._isfilebackend() != True:
+            self._backend.put_page(hashdg, gzbys)
+            return
+        with self._lock(True):
+            fpath_idx: pathlib.Path = self.tmpdir / self.__fname_idx
+            if fpath_idx.is_file() != True:
+                with open(fpath_idx, 'wb') as fp:
+                    fp.write(self.__idx_header.pack(self.__idx_magic, 0))
+            with open(self.tmpdir / self.__fname_pack, 'ab') as fp:
+                offset: int = fp.seek(0, os.SEEK_END)
+                fp.write(gzbys)
+            record: bytes = self.__idx_record.pack(
+                bytes.fromhex(hashdg), offset, len(gzbys))
+            with open(fpath_idx, 'ab') as fp:
+                fp.write(record)
+        return
+
+    def compact(self, force: bool = False):
+        if self._isfilebackend() != True:
+            return
+        if (self.tmpdir / self.__fname_idx).is_file() != True:
+            return
+        with self._lock(True):
+            nsorted, records = self._read_idx()
+            if force != True and len(records) - nsorted < self.compact_threshold:
+                return
+            latest: dict = dict()
+            for key, offset, length in records:
+                latest[key] = (offset, length)
+            fpath_pack: pathlib.Path = self.tmpdir / self.__fname_pack
+            fpath_idx: pathlib.Path = self.tmpdir / self.__fname_idx
+            tmppack: pathlib.Path = fpath_pack.with_name(
+                '{0}.{1}.tmp'.format(fpath_pack.name, os.getpid()))
+            tmpidx: pathlib.Path = fpath_idx.with_name(
+                '{0}.{1}.tmp'.format(fpath_idx.name, os.getpid()))
+            newrecords: list = list()
+            with open(fpath_pack, 'rb') as fp, open(tmppack, 'wb') as wfp:
+                for key in sorted(latest.keys()):
+                    offset, length = latest[key]
+                    fp.seek(offset)
+                    newrecords.append(self.__idx_record.pack(
+                        key, wfp.tell(), length))
+                    wfp.write(fp.read(length))
+            with open(tmpidx, 'wb') as fp:
+                fp.write(self.__idx_header.pack(
+                    self.__idx_magic, len(newrecords)))
+                fp.write(b''.join(newrecords))
+            os.replace(tmppack, fpath_pack)
+            os.replace(tmpidx, fpath_idx)
+        return
+
+
+class Man_searchindex(object):
+    def __init__(self):
+        self._keys: tuple = tuple()
+        self._lowkeys: tuple = tuple()
+        self._grams: dict = dict()
+        return
+
+    @property
+    def keys(self) -> tuple:
+        return self._keys
+
+    def init(self, keys: list | tuple):
+        if isinstance(keys, list) != True and isinstance(keys, tuple) != True:
+            errmes: str = 'Error: keys is NOT list or tuple type.'
+            raise TypeError(errmes)
+        pairs: list = sorted([(k.lower(), k) for k in keys])
+        self._lowkeys = tuple([low for low, k in pairs])
+        self._keys = tuple([k for low, k in pairs])
+        grams: dict = dict()
+        for i, low in enumerate(self._lowkeys):
+            for n in (1, 2, 3):
+                for gram in set([low[j:j + n] for j in range(len(low) - n + 1)]):
+                    grams.setdefault(gram, list()).append(i)
+        self._grams = grams
+        return
+
+    def search_prefix(self, prefix: str) -> list:
+        low: str = prefix.lower()
+        start: int = bisect.bisect_left(self._lowkeys, low)
+        end: int = bisect.bisect_left(self._lowkeys, low + '\U0010ffff', start)
+        return list(self._keys[start:end])
+
+    def search(self, pattern: str, limit: int = 0) -> list:
+        low: str = pattern.lower()
+        if low == '':
+            return list()
+        prefix: list = self.search_prefix(low)
+        ids: typing.Iterable
+        if len(low) <= 2:
+            ids = self._grams.get(low, list())
+        else:
+            postings: list = [self._grams.get(low[j:j + 3], list())
+                              for j in range(len(low) - 2)]
+            postings.sort(key=len)
+            idset: set = set(postings[0])
+            for posting in postings[1:]:
+                idset.intersection_update(posting)
+                if len(idset) == 0:
+                    break
+            ids = sorted(idset)
+        substr: list = [self._keys[i] for i in ids
+                        if low in self._lowkeys[i] and self._lowkeys[i].startswith(low) != True]
+        retlist: list = prefix + substr
+        if limit >= 1:
+            return retlist[:limit]
+        return retlist
+
+
+class Man_aproposindex(object):
+    __fname_docs: typing.Final[str] = 'apropos_docs.txt'
+    __fname_terms: typing.Final[str] = 'apropos_terms.txt'
+    __fname_log: typing.Final[str] = 'apropos_log.txt'
+    __fname_lock: typing.Final[str] = 'apropos.lock'
+    __ptn_token: typing.Final[re.Pattern] = re.compile(r'[0-9a-z_]+|[^\W\x00-\x7f]+')
+    __ptn_namedesc: typing.Final[re.Pattern] = re.compile(
+        r'\s*(\S.*?)\s+[-\u2010-\u2015]\s+(\S.*?)\s*$')
+    compact_threshold: int = 32
+
+    def __init__(self):
+        self._tmpdir: pathlib.Path = pathlib.Path('.')
+        self._keys: set | None = None
+        self._nlog: int = 0
+        return
+
+    @property
+    def tmpdir(self):
+        return self._tmpdir
+
+    def init(self, tmpdir: pathlib.Path):
+        errmes = ''
+        if isinstance(tmpdir, pathlib.PosixPath) != True and isinstance(tmpdir, pathlib.WindowsPath) != True:
+            errmes = 'Error: tmpdir is NOT PosixPath or WindowsPath object.'
+            raise TypeError(errmes)
+        self._tmpdir = tmpdir
+        self._keys = None
+        return
+
+    def _lock(self, exclusive: bool):
+        fp = open(self.tmpdir / self.__fname_lock, 'ab')
+        if sys.platform != 'win32':
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return fp
+
+    @staticmethod
+    def tokenize(text: str) -> set:
+        tokens: set = set()
+        for run in Man_aproposindex.__ptn_token.findall(text.lower()):
+            if run[0] <= '\x7f':
+                if len(run) >= 2:
+                    tokens.add(run)
+            else:
+                tokens.update([run[i:i + 2] for i in range(len(run) - 1)])
+                tokens.add(run[-1])
+        return tokens
+
+    @staticmethod
+    def make_description(name: str, pagerstr: str) -> str:
+        for line in pagerstr.splitlines()[:60]:
+            reobj = Man_aproposindex.__ptn_namedesc.match(line)
+            if reobj == None or name not in reobj.group(1):
+                continue
+            return reobj.group(2).replace('\t', ' ')
+        return ''
+
+    def _load_docs(self) -> dict:
+        docs: dict = dict()
+        fpath: pathlib.Path = self.tmpdir / self.__fname_docs
+        if fpath.is_file() != True:
+            return docs
+        with open(fpath, 'rt', encoding='UTF-8') as fp:
+            for line in fp:
+                splitted: list = line.rstrip('\n').split('\t', 3)
+                if len(splitted) == 4:
+                    docs[int(splitted[0])] = tuple(splitted[1:])
+        return docs
+
+    def _load_log(self) -> list:
+        entries: list = list()
+        fpath: pathlib.Path = self.tmpdir / self.__fname_log
+        if fpath.is_file() != True:
+            return entries
+        with open(fpath, 'rt', encoding='UTF-8') as fp:
+            for line in fp:
+                if line.endswith('\n') != True:
+                    continue
+                splitted: list = line.rstrip('\n').split('\t', 3)
+                if len(splitted) == 4:
+                    entries.append((splitted[0], splitted[1], splitted[2],
+                                    [t for t in splitted[3].split(' ') if t != '']))
+        return entries
+
+    def _load_keys(self) -> set:
+        keys: set = set()
+        nlog: int = 0
+        for fname, start in ((self.__fname_docs, 1), (self.__fname_log, 0)):
+            fpath: pathlib.Path = self.tmpdir / fname
+            if fpath.is_file() != True:
+                continue
+            with open(fpath, 'rt', encoding='UTF-8') as fp:
+                for line in fp:
+                    if line.endswith('\n') != True:
+                        continue
+                    splitted: list = line.split('\t', start + 2)
+                    if len(splitted) == start + 3:
+                        keys.add((splitted[start], splitted[start + 1]))
+                        nlog += 1 if start == 0 else 0
+        self._nlog = nlog
+        return keys
+
+    def has(self, key: str, hashdg: str) -> bool:
+        if self._keys == None:
+            self._keys = self._load_keys()
+        return (key, hashdg) in self._keys
+
+    def add(self, key: str, hashdg: str, pagerstr: str):
+        errmes: str = ''
+        if re.fullmatch(r'[0-9a-f]{64}', hashdg) == None:
+            errmes = 'Error: Not hashdg string. [{0}]'.format(hashdg)
             raise MmanStdError(errmes)
-        fname: str = splitted[1]
-        ptn: str = r'[0-9a-f]{6}\.[1-9a-z]\.gz$'
-        if re.match(ptn, fname) == None:
-            errmes = 'Error: Not pager format. [{0}]'.format(fname)
+        if key == '' or re.search(r'[\t\n ]', key) != None:
+            errmes = 'Error: Invalid page key. [{0}]'.format(key)
             raise MmanStdError(errmes)
-        fpath: pathlib.PosixPath | pathlib.WindowsPath
-        fpath = self.tmpdir / fname
-        with open(str(fpath), 'wb') as fp:
-            fp.write(gzbys)
+        if self.has(key, hashdg):
+            return
+        name: str = key.rpartition('.')[0] if '.' in key else key
+        desc: str = self.make_description(name, pagerstr)
+        tokens: set = self.tokenize(pagerstr)
+        tokens.update(self.tokenize(name))
+        line: str = '{0}\t{1}\t{2}\t{3}\n'.format(
+            key, hashdg, desc, ' '.join(sorted(tokens)))
+        fpath: pathlib.Path = self.tmpdir / self.__fname_log
+        with self._lock(True):
+            with open(fpath, 'ab') as fp:
+                fp.write(line.encode('UTF-8'))
+        self._keys.add((key, hashdg))
+        self._nlog += 1
+        if self._nlog >= self.compact_threshold:
+            self.compact()
         return
 
+    def compact(self):
+        with self._lock(True):
+            self._compact()
+        self._nlog = 0
+        return
+
+    def _compact(self):
+        docs: dict = self._load_docs()
+        terms: dict = dict()
+        fpath_terms: pathlib.Path = self.tmpdir / self.__fname_terms
+        if fpath_terms.is_file():
+            with open(fpath_terms, 'rt', encoding='UTF-8') as fp:
+                for line in fp:
+                    term, sep, ids = line.rstrip('\n').partition('\t')
+                    terms[term] = [int(i) for i in ids.split(',')]
+        keyids: dict = {v[0]: docid for docid, v in docs.items()}
+        nextid: int = max(docs.keys()) + 1 if len(docs) >= 1 else 0
+        for key, hashdg, desc, tokens in self._load_log():
+            if key in keyids:
+                del docs[keyids[key]]
+            docs[nextid] = (key, hashdg, desc)
+            keyids[key] = nextid
+            for token in tokens:
+                terms.setdefault(token, list()).append(nextid)
+            nextid += 1
+        docslines: list = ['{0}\t{1}\t{2}\t{3}\n'.format(docid, *v)
+                           for docid, v in sorted(docs.items())]
+        termslines: list = list()
+        for term in sorted(terms.keys(), key=lambda x: x.encode('UTF-8')):
+            ids: list = [i for i in terms[term] if i in docs]
+            if len(ids) >= 1:
+                termslines.append('{0}\t{1}\n'.format(
+                    term, ','.join([str(i) for i in ids])))
+        for fname, lines in ((self.__fname_terms, termslines), (self.__fname_docs, docslines)):
+            Man_cache._write_atomic(self.tmpdir / fname,
+                                    ''.join(lines).encode('UTF-8'))
+        (self.tmpdir / self.__fname_log).unlink(missing_ok=True)
+        return
+
+    @staticmethod
+    def _bisect_terms(mm: mmap.mmap, term: bytes) -> int:
+        lo: int = 0
+        hi: int = len(mm)
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            start: int = mm.rfind(b'\n', 0, mid) + 1
+            end: int = mm.find(b'\t', start)
+            if end == -1 or mm[start:end] < term:
+                nl: int = mm.find(b'\n', start)
+                lo = len(mm) if nl == -1 else nl + 1
+            else:
+                hi = start
+        return lo
+
+    @staticmethod
+    def _lookup_terms(mm: mmap.mmap, term: str, prefix: bool) -> set:
+        ids: set = set()
+        bterm: bytes = term.encode('UTF-8')
+        pos: int = Man_aproposindex._bisect_terms(mm, bterm)
+        while pos < len(mm):
+            nl: int = mm.find(b'\n', pos)
+            nl = len(mm) if nl == -1 else nl
+            line: bytes = mm[pos:nl]
+            t, sep, idsbys = line.partition(b'\t')
+            if t == bterm or (prefix and t.startswith(bterm)):
+                ids.update([int(i) for i in idsbys.split(b',')])
+            else:
+                break
+            pos = nl + 1
+        return ids
+
+    @staticmethod
+    def _isprefix_token(token: str) -> bool:
+        return token[0] <= '\x7f' or len(token) == 1
+
+    def search(self, word: str) -> list:
+        qtokens: set = self.tokenize(word)
+        if len(qtokens) >= 2:
+            qtokens = set([t for t in qtokens if len(t) >= 2 or t[0] <= '\x7f'])
+        if len(qtokens) == 0:
+            return list()
+        with self._lock(False):
+            return self._search(word, qtokens)
+
+    def _search(self, word: str, qtokens: set) -> list:
+        docs: dict = self._load_docs()
+        matches: dict = dict()
+        fpath_terms: pathlib.Path = self.tmpdir / self.__fname_terms
+        if fpath_terms.is_file() and fpath_terms.stat().st_size >= 1:
+            with open(fpath_terms, 'rb') as fp:
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    idset: set | None = None
+                    for token in sorted(qtokens, key=len, reverse=True):
+                        ids: set = self._lookup_terms(
+                            mm, token, self._isprefix_token(token))
+                        idset = ids if idset == None else idset & ids
+                        if len(idset) == 0:
+                            break
+            for docid in idset:
+                if docid in docs:
+                    key, hashdg, desc = docs[docid]
+                    matches[key] = desc
+        for key, hashdg, desc, tokens in self._load_log():
+            matches.pop(key, None)
+            hitall: bool = True
+            for qtoken in qtokens:
+                i: int = bisect.bisect_left(tokens, qtoken)
+                hit: bool = i < len(tokens) and tokens[i] == qtoken
+                if hit != True and self._isprefix_token(qtoken):
+                    hit = i < len(tokens) and tokens[i].startswith(qtoken)
+                if hit != True:
+                    hitall = False
+                    break
+            if hitall:
+                matches[key] = desc
+        lowword: str = word.lower()
+
+        def rankkey(item: tuple) -> tuple:
+            key, desc = item
+            name: str = key.rpartition('.')[0] if '.' in key else key
+            return (lowword not in name.lower(), lowword not in desc.lower(), key)
+        return sorted(matches.items(), key=rankkey)
+
+
+class Man_resolver(object):
+    timeout: float = 0.8
+    ttl: int = 300
+    negative_ttl: int = 30
+    maxthreads: int = 8
+    _fname_cache: typing.Final[str] = 'resolver.json'
+    _cache: dict = dict()
+    _pending: dict = dict()
+    _lock: threading.Lock = threading.Lock()
+    _semaphore: threading.BoundedSemaphore = threading.BoundedSemaphore(maxthreads)
+    _pid: int = os.getpid()
+    _cachedir: pathlib.Path | None = None
 
-class Cargo(object):
     @staticmethod
-    def _is_resolvable_hostname_resolver(hostname: str, retqueue):
-        ret: bool = False
+    def _reset_ifforked():
+        subr = Man_resolver
+        if subr._pid == os.getpid():
+            return
+        subr._lock = threading.Lock()
+        subr._semaphore = threading.BoundedSemaphore(subr.maxthreads)
+        subr._pending = dict()
+        subr._pid = os.getpid()
+        return
+
+    @staticmethod
+    def set_cachedir(cachedir: pathlib.Path):
+        subr = Man_resolver
+        if isinstance(cachedir, pathlib.PosixPath) != True and isinstance(cachedir, pathlib.WindowsPath) != True:
+            errmes: str = 'Error: cachedir is NOT PosixPath or WindowsPath object.'
+            raise TypeError(errmes)
+        subr._reset_ifforked()
+        fpath: pathlib.Path = cachedir / subr._fname_cache
+        loaded: dict = dict()
         try:
-            socket.getaddrinfo(hostname, None)
-            ret = True
-        except:
+            with open(fpath, 'rt', encoding='UTF-8') as fp:
+                obj: dict = json.load(fp)
+            for k, (expire, infos) in obj.items():
+                host, sep, port = k.rpartition(':')
+                addrinfos: list = [(family, socktype, proto, '', tuple(sockaddr))
+                                   for family, socktype, proto, sockaddr in infos]
+                loaded[(host, int(port))] = (float(expire), addrinfos)
+        except (OSError, ValueError, TypeError):
+            pass
+        now: float = time.time()
+        with subr._lock:
+            subr._cachedir = cachedir
+            for key, entry in loaded.items():
+                if entry[0] > now and key not in subr._cache:
+                    subr._cache[key] = entry
+        return
+
+    @staticmethod
+    def _store_diskcache():
+        subr = Man_resolver
+        if subr._cachedir == None:
+            return
+        now: float = time.time()
+        with subr._lock:
+            obj: dict = {'{0}:{1}'.format(host, port):
+                         [expire, [[family, socktype, proto, list(sockaddr)]
+                                   for family, socktype, proto, cname, sockaddr in addrinfos]]
+                         for (host, port), (expire, addrinfos) in subr._cache.items()
+                         if addrinfos != None and expire > now}
+            fpath: pathlib.Path = subr._cachedir / subr._fname_cache
+        tmpfpath: pathlib.Path = fpath.with_name(
+            '{0}.{1}.{2}.tmp'.format(fpath.name, os.getpid(), threading.get_ident()))
+        try:
+            with open(tmpfpath, 'wt', encoding='UTF-8') as fp:
+                json.dump(obj, fp)
+            os.replace(tmpfpath, fpath)
+        except OSError:
+            pass
+        return
+
+    @staticmethod
+    def _resolver(key: tuple, event: threading.Event):
+        subr = Man_resolver
+        host, port = key
+        addrinfos: list | None = None
+        with subr._semaphore:
+            try:
+                addrinfos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except (OSError, UnicodeError):
+                addrinfos = None
+        ttl: int = subr.ttl if addrinfos != None else subr.negative_ttl
+        with subr._lock:
+            subr._cache[key] = (time.time() + ttl, addrinfos)
+            subr._pending.pop(key, None)
+        event.set()
+        if addrinfos != None:
+            subr._store_diskcache()
+        return
+
+    @staticmethod
+    def _isnumeric_host(host: str) -> bool:
+        for family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                socket.inet_pton(family, host)
+            except (OSError, ValueError):
+                continue
+            return True
+        return False
+
+    @staticmethod
+    def resolve(host: str, port: int = 443, timeout: float | None = None) -> list:
+        subr = Man_resolver
+        errmes: str = ''
+        if subr._isnumeric_host(host):
+            return socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        subr._reset_ifforked()
+        timeout = subr.timeout if timeout == None else timeout
+        key: typing.Final[tuple] = (host, port)
+        event: threading.Event
+        with subr._lock:
+            entry: tuple | None = subr._cache.get(key)
+            if entry != None and entry[0] > time.time():
+                if entry[1] == None:
+                    errmes = 'Error: Not resolvable hostname. [{0}]'.format(
+                        host)
+                    raise socket.gaierror(socket.EAI_NONAME, errmes)
+                return entry[1]
+            event = subr._pending.get(key)
+            if event == None:
+                event = threading.Event()
+                subr._pending[key] = event
+                threading.Thread(target=subr._resolver, args=(key, event),
+                                 daemon=True).start()
+        if event.wait(timeout) != True:
+            errmes = 'Error: Timeout of resolving hostname. [{0}]'.format(
+                host)
+            raise TimeoutError(errmes)
+        with subr._lock:
+            entry = subr._cache.get(key)
+        if entry == None or entry[1] == None:
+            errmes = 'Error: Not resolvable hostname. [{0}]'.format(host)
+            raise socket.gaierror(socket.EAI_NONAME, errmes)
+        return entry[1]
+
+    @staticmethod
+    def is_resolvable(host: str, timeout: float | None = None) -> bool:
+        try:
+            Man_resolver.resolve(host, 443, timeout)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def forget(host: str, port: int):
+        with Man_resolver._lock:
+            Man_resolver._cache.pop((host, port), None)
+        return
+
+    @staticmethod
+    def create_connection(address: tuple, timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
+                          source_address: tuple | None = None, *args, **kwargs) -> socket.socket:
+        subr = Man_resolver
+        host, port = address
+        resolvetimeout: float | None = None
+        if isinstance(timeout, (int, float)):
+            resolvetimeout = max(float(timeout), subr.timeout)
+        addrinfos: list = subr.resolve(host, port, resolvetimeout)
+        lasterr: OSError | None = None
+        for family, socktype, proto, cname, sockaddr in addrinfos:
+            sock: socket.socket | None = None
+            try:
+                sock = socket.socket(family, socktype, proto)
+                if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                    sock.settimeout(timeout)
+                if source_address != None:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as e:
+                lasterr = e
+                if sock != None:
+                    sock.close()
+        subr.forget(host, port)
+        if lasterr != None:
+            raise lasterr
+        errmes: str = 'Error: Empty address list. [{0}]'.format(host)
+        raise OSError(errmes)
+
+
+class Man_circuitbreaker(object):
+    threshold: int = 3
+    cooldown: float = 300.0
+    trialwindow: float = 5.0
+    _fname_state: typing.Final[str] = 'circuitbreaker.json'
+    _fname_lock: typing.Final[str] = 'circuitbreaker.lock'
+    _state: dict = dict()
+    _lock: threading.Lock = threading.Lock()
+    _pid: int = os.getpid()
+    _cachedir: pathlib.Path | None = None
+
+    @staticmethod
+    def _reset_ifforked():
+        subr = Man_circuitbreaker
+        if subr._pid == os.getpid():
+            return
+        subr._lock = threading.Lock()
+        subr._pid = os.getpid()
+        return
+
+    @staticmethod
+    def set_cachedir(cachedir: pathlib.Path):
+        subr = Man_circuitbreaker
+        if isinstance(cachedir, pathlib.PosixPath) != True and isinstance(cachedir, pathlib.WindowsPath) != True:
+            errmes: str = 'Error: cachedir is NOT PosixPath or WindowsPath object.'
+            raise TypeError(errmes)
+        subr._reset_ifforked()
+        state: dict = subr._load_state(cachedir)
+        with subr._lock:
+            subr._cachedir = cachedir
+            subr._state = state
+        return
+
+    @staticmethod
+    def _load_state(cachedir: pathlib.Path) -> dict:
+        subr = Man_circuitbreaker
+        state: dict = dict()
+        try:
+            with open(cachedir / subr._fname_state, 'rt', encoding='UTF-8') as fp:
+                obj: dict = json.load(fp)
+            for host, v in obj.items():
+                state[host] = {'failures': int(v['failures']),
+                               'openuntil': float(v['openuntil'])}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            pass
+        return state
+
+    @staticmethod
+    def _update(host: str, func) -> typing.Any:
+        subr = Man_circuitbreaker
+        subr._reset_ifforked()
+        cachedir: pathlib.Path | None = subr._cachedir
+        if cachedir == None:
+            with subr._lock:
+                return func(subr._state)
+        try:
+            lockfp = open(cachedir / subr._fname_lock, 'ab')
+        except OSError:
+            with subr._lock:
+                return func(subr._state)
+        try:
+            if sys.platform != 'win32':
+                fcntl.flock(lockfp.fileno(), fcntl.LOCK_EX)
+            state: dict = subr._load_state(cachedir)
+            before: dict | None = None if host not in state else dict(state[host])
+            ret: typing.Any = func(state)
+            if state.get(host) != before:
+                subr._write_state(cachedir, state)
+            with subr._lock:
+                subr._state = state
+        finally:
+            lockfp.close()
+        return ret
+
+    @staticmethod
+    def _write_state(cachedir: pathlib.Path, state: dict):
+        subr = Man_circuitbreaker
+        fpath: pathlib.Path = cachedir / subr._fname_state
+        tmpfpath: pathlib.Path = fpath.with_name(
+            '{0}.{1}.{2}.tmp'.format(fpath.name, os.getpid(), threading.get_ident()))
+        try:
+            with open(tmpfpath, 'wt', encoding='UTF-8') as fp:
+                fp.write(json.dumps(state))
+            os.replace(tmpfpath, fpath)
+        except OSError:
             pass
-        retqueue.put(ret, timeout=1)
         return
 
+    @staticmethod
+    def makekey(url: str) -> str:
+        parsed = urllib.parse.urlsplit(url)
+        port: int | None = parsed.port
+        if port == None:
+            port = 443 if parsed.scheme == 'https' else 80
+        return '{0}:{1}'.format(parsed.hostname or '', port)
+
+    @staticmethod
+    def allow(host: str) -> bool:
+        subr = Man_circuitbreaker
+        subr._reset_ifforked()
+        with subr._lock:
+            v: dict | None = subr._state.get(host)
+            if v == None or v['failures'] < subr.threshold:
+                return True
+            if time.time() < v['openuntil']:
+                return False
+
+        def claim(state: dict) -> bool:
+            v: dict | None = state.get(host)
+            if v == None or v['failures'] < subr.threshold:
+                return True
+            if time.time() < v['openuntil']:
+                return False
+            v['openuntil'] = time.time() + subr.trialwindow
+            return True
+        return subr._update(host, claim)
+
+    @staticmethod
+    def record_success(host: str):
+        subr = Man_circuitbreaker
+
+        def reset(state: dict):
+            state.pop(host, None)
+            return
+        with subr._lock:
+            if host not in subr._state:
+                return
+        subr._update(host, reset)
+        return
+
+    @staticmethod
+    def record_failure(host: str):
+        subr = Man_circuitbreaker
+
+        def count(state: dict):
+            v: dict = state.setdefault(host, {'failures': 0, 'openuntil': 0.0})
+            v['failures'] += 1
+            if v['failures'] >= subr.threshold:
+                v['openuntil'] = time.time() + subr.cooldown
+            return
+        subr._update(host, count)
+        return
+
+    @staticmethod
+    def filter_urls(urls: tuple | list) -> tuple:
+        subr = Man_circuitbreaker
+        allowed: tuple = tuple([url for url in urls if subr.allow(subr.makekey(url))])
+        return allowed if len(allowed) >= 1 else tuple(urls)
+
+
+class Man_transport_response(typing.NamedTuple):
+    status: int
+    reason: str
+    headers: http.client.HTTPMessage
+    body: bytes
+    url: str
+
+    def string(self) -> str:
+        return self.body.decode('UTF-8')
+
+
+class Man_transport(object):
+    timeout: float = 10.0
+    maxredirects: int = 5
+    maxidle: int = 4
+    retries: int = 3
+    backoff_base: float = 0.1
+    backoff_max: float = 2.0
+    retry_statuses: tuple = (429, 500, 502, 503, 504)
+    rate: float = 4.0
+    burst: float = 8.0
+    _pool: dict = dict()
+    _buckets: dict = dict()
+    _lock: threading.Lock = threading.Lock()
+    _pid: int = os.getpid()
+    _sslcontext: ssl.SSLContext | None = None
+    _proxies: dict | None = None
+
+    @staticmethod
+    def _reset_ifforked():
+        subr = Man_transport
+        if subr._pid == os.getpid():
+            return
+        subr._lock = threading.Lock()
+        subr._pool = dict()
+        subr._buckets = dict()
+        subr._pid = os.getpid()
+        return
+
+    @staticmethod
+    def _getproxy(scheme: str, host: str) -> tuple:
+        subr = Man_transport
+        if subr._proxies == None:
+            subr._proxies = urllib.request.getproxies()
+        proxyurl: str = subr._proxies.get(scheme, '')
+        if proxyurl == '' or urllib.request.proxy_bypass(host):
+            return tuple()
+        if '://' not in proxyurl:
+            proxyurl = 'http://' + proxyurl
+        parsed = urllib.parse.urlsplit(proxyurl)
+        if parsed.hostname == None:
+            return tuple()
+        auth: str = ''
+        if parsed.username != None:
+            userpass: str = '{0}:{1}'.format(urllib.parse.unquote(parsed.username),
+                                             urllib.parse.unquote(parsed.password or ''))
+            auth = 'Basic ' + base64.b64encode(userpass.encode('UTF-8')).decode('ascii')
+        port: int = parsed.port if parsed.port != None else 8080
+        return (parsed.hostname, port, auth)
+
+    @staticmethod
+    def _take_token(host: str, deadline: float):
+        subr = Man_transport
+        while True:
+            with subr._lock:
+                now: float = time.monotonic()
+                tokens, last = subr._buckets.get(host, (subr.burst, now))
+                tokens = min(subr.burst, tokens + (now - last) * subr.rate)
+                if tokens >= 1.0:
+                    subr._buckets[host] = (tokens - 1.0, now)
+                    return
+                subr._buckets[host] = (tokens, now)
+                wait: float = (1.0 - tokens) / subr.rate
+            if now + wait > deadline:
+                errmes: str = 'Error: Rate limit wait exceeds the timeout. [{0}]'.format(
+                    host)
+                raise MmanRateLimitError(errmes)
+            time.sleep(wait)
+
+    @staticmethod
+    def _getconn(scheme: str, host: str, port: int, timeout: float,
+                 proxy: tuple = tuple()) -> tuple:
+        subr = Man_transport
+        key: typing.Final[tuple] = (scheme, host, port, proxy)
+        with subr._lock:
+            conns: list = subr._pool.get(key, list())
+            if len(conns) >= 1:
+                conn = conns.pop()
+                conn.timeout = timeout
+                if conn.sock != None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        connhost, connport = (proxy[0], proxy[1]) if len(proxy) >= 1 else (host, port)
+        if scheme == 'https':
+            if subr._sslcontext == None:
+                subr._sslcontext = ssl.create_default_context()
+            conn = _Man_resolver_httpsconnection(connhost, connport, timeout=timeout,
+                                                 context=subr._sslcontext)
+            if len(proxy) >= 1:
+                tunnelheaders: dict = {'Proxy-Authorization': proxy[2]} if proxy[2] != '' else dict()
+                conn.set_tunnel(host, port, headers=tunnelheaders)
+        else:
+            conn = _Man_resolver_httpconnection(connhost, connport, timeout=timeout)
+        return conn, False
+
+    @staticmethod
+    def _putconn(scheme: str, host: str, port: int, conn: http.client.HTTPConnection,
+                 proxy: tuple = tuple()):
+        subr = Man_transport
+        key: typing.Final[tuple] = (scheme, host, port, proxy)
+        with subr._lock:
+            conns: list = subr._pool.setdefault(key, list())
+            if len(conns) < subr.maxidle:
+                conns.append(conn)
+                return
+        conn.close()
+        return
+
+    @staticmethod
+    def _request_once(url: str, headers: dict, deadline: float) -> Man_transport_response:
+        subr = Man_transport
+        errmes: str = ''
+        for i in range(subr.maxredirects + 1):
+            parsed = urllib.parse.urlsplit(url)
+            if parsed.scheme not in ('http', 'https') or parsed.hostname == None:
+                errmes = 'Error: Not http or https url. [{0}]'.format(url)
+                raise ValueError(errmes)
+            scheme: str = parsed.scheme
+            host: str = parsed.hostname
+            port: int = parsed.port if parsed.port != None else (
+                443 if scheme == 'https' else 80)
+            path: str = parsed.path if parsed.path != '' else '/'
+            path += '?' + parsed.query if parsed.query != '' else ''
+            proxy: tuple = subr._getproxy(scheme, host)
+            reqheaders: dict = headers
+            if len(proxy) >= 1 and scheme == 'http':
+                path = urllib.parse.urlunsplit((scheme, parsed.netloc, path, '', ''))
+                if proxy[2] != '':
+                    reqheaders = dict(headers, **{'Proxy-Authorization': proxy[2]})
+            subr._take_token(host, deadline)
+            while True:
+                remain: float = max(deadline - time.monotonic(), 0.001)
+                conn, reused = subr._getconn(scheme, host, port, remain, proxy)
+                try:
+                    conn.request('GET', path, headers=reqheaders)
+                    response = conn.getresponse()
+                    body: bytes = response.read()
+                except (http.client.RemoteDisconnected, ConnectionResetError,
+                        BrokenPipeError, http.client.BadStatusLine):
+                    conn.close()
+                    if reused:
+                        continue
+                    raise
+                except:
+                    conn.close()
+                    raise
+                break
+            if response.will_close:
+                conn.close()
+            else:
+                subr._putconn(scheme, host, port, conn, proxy)
+            location: str = response.headers.get('Location', '')
+            if response.status in (301, 302, 303, 307, 308) and location != '':
+                url = urllib.parse.urljoin(url, location)
+                continue
+            return Man_transport_response(status=response.status, reason=response.reason,
+                                          headers=response.headers, body=body, url=url)
+        errmes = 'Error: Too many redirects. [{0}]'.format(url)
+        raise MmanStdError(errmes)
+
+    @staticmethod
+    def _retryafter(response: Man_transport_response) -> float:
+        value: str = response.headers.get('Retry-After', '').strip()
+        if value == '':
+            return 0.0
+        if value.isdigit():
+            return float(value)
+        try:
+            retrytime = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0.0
+        return max(0.0, retrytime.timestamp() - time.time())
+
+    @staticmethod
+    def request(url: str, headers: dict | None = None,
+                timeout: float | None = None, retries: int | None = None) -> Man_transport_response:
+        subr = Man_transport
+        key: typing.Final[str] = Man_circuitbreaker.makekey(url)
+        try:
+            response: Man_transport_response = subr._request_retry(
+                url, headers, timeout, retries)
+        except MmanRateLimitError:
+            raise
+        except (OSError, http.client.HTTPException):
+            Man_circuitbreaker.record_failure(key)
+            raise
+        if response.status >= 500:
+            Man_circuitbreaker.record_failure(key)
+        else:
+            Man_circuitbreaker.record_success(key)
+        return response
+
+    @staticmethod
+    def _request_retry(url: str, headers: dict | None,
+                       timeout: float | None, retries: int | None) -> Man_transport_response:
+        subr = Man_transport
+        subr._reset_ifforked()
+        timeout = subr.timeout if timeout == None else timeout
+        retries = subr.retries if retries == None else retries
+        deadline: typing.Final[float] = time.monotonic() + timeout
+        headers = dict() if headers == None else dict(headers)
+        response: Man_transport_response | None = None
+        for attempt in range(retries + 1):
+            wait: float = 0.0
+            try:
+                response = subr._request_once(url, headers, deadline)
+            except (ConnectionError, http.client.HTTPException):
+                if attempt >= retries:
+                    raise
+                response = None
+            else:
+                if response.status not in subr.retry_statuses or attempt >= retries:
+                    return response
+                wait = subr._retryafter(response)
+            backoff: float = min(subr.backoff_max,
+                                 subr.backoff_base * (2 ** attempt))
+            wait = max(wait, random.uniform(0.0, backoff))
+            if time.monotonic() + wait >= deadline:
+                if response != None:
+                    return response
+                errmes: str = 'Error: Retry deadline exceeded. [{0}]'.format(
+                    url)
+                raise TimeoutError(errmes)
+            time.sleep(wait)
+        return response
+
+    @staticmethod
+    def loadbytes(url: str, headers: dict | None = None,
+                  timeout: float | None = None, exception: bool = True) -> bytes:
+        errmes: str = ''
+        try:
+            response: Man_transport_response = Man_transport.request(
+                url, headers, timeout)
+        except (OSError, http.client.HTTPException, ValueError, MmanStdError) as e:
+            if exception != True:
+                return b''
+            errmes = 'Error: URL Error. {0}, URL: {1}'.format(e, url)
+            raise MmanStdError(errmes)
+        if 200 <= response.status < 300:
+            return response.body
+        if exception != True:
+            return b''
+        errmes = 'Error: HTTP Error. {0} {1}, URL: {2}'.format(
+            response.status, response.reason, url)
+        raise MmanStdError(errmes)
+
+    @staticmethod
+    def close():
+        subr = Man_transport
+        with subr._lock:
+            pool: dict = subr._pool
+            subr._pool = dict()
+        for conns in pool.values():
+            [conn.close() for conn in conns]
+        return
+
+
+class _Man_resolver_httpconnection(http.client.HTTPConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = Man_resolver.create_connection
+        return
+
+
+class _Man_resolver_httpsconnection(http.client.HTTPSConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = Man_resolver.create_connection
+        return
+
+
+class Cargo(object):
     @staticmethod
     def is_resolvable_hostname(url: str, timeout=1) -> bool:
-        subr = Cargo
         errmes: str = ''
         s: str = ''
         ptn: str = r'https\:\/\/[0-9a-zA-Z\.\_\-]+'
@@ -876,21 +2694,4 @@ class Cargo(object):
             raise ValueError(errmes)
         s = reobj.group() if reobj != None else ''  # type: ignore
         hostname: str = s.removeprefix('https://')
-        retqueue: multiprocessing.queues.Queue = multiprocessing.Queue()
-        func: typing.Callable = subr._is_resolvable_hostname_resolver
-        pobj = multiprocessing.Process(target=func, args=(hostname, retqueue))
-        pobj.start()
-        resolvable: bool = False
-        time_end: int = int(time.time()) + timeout
-        while time_end >= int(time.time()):
-            try:
-                resolvable = retqueue.get_nowait()
-            except:
-                time.sleep(0.1)
-                continue
-            break
-        if pobj.is_alive():
-            pobj.terminate()
-            time.sleep(0.1)
-        pobj.close()
-        return resolvable
+        return Man_resolver.is_resolvable(hostname, timeout)
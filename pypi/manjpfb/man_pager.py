@@ -0,0 +1,341 @@
+#!/usr/bin/env python3.9
+# -*- coding: utf-8 -*-
+# manjpfb, FreeBSD Japanese-Man Pager.
+# Copyright (C) 2024 MikeTurkey All rights reserved.
+# contact: voice[ATmark]miketurkey.com
+# license: GPLv3 License
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ADDITIONAL MACHINE LEARNING PROHIBITION CLAUSE
+#
+# In addition to the rights granted under the applicable license(GPL-3),
+# you are expressly prohibited from using any form of machine learning,
+# artificial intelligence, or similar technologies to analyze, process,
+# or extract information from this software, or to create derivative
+# works based on this software.
+#
+# This prohibition includes, but is not limited to, training machine
+# learning models, neural networks, or any other automated systems using
+# the code or output of this software.
+#
+# The purpose of this prohibition is to protect the integrity and
+# intended use of this software. If you wish to use this software for
+# machine learning or similar purposes, you must seek explicit written
+# permission from the copyright holder.
+#
+# see also 
+#     GPL-3 Licence: https://www.gnu.org/licenses/gpl-3.0.html.en
+#     Mike Turkey.com: https://miketurkey.com/
+
+
+import os
+import sys
+import re
+import mmap
+import array
+import bisect
+import locale
+import pathlib
+try:
+    import curses
+except ImportError:
+    curses = None
+if __name__ == '__main__':
+    from man_layout import Man_layout
+else:
+    try:
+        from .man_layout import Man_layout
+    except:
+        from man_layout import Man_layout
+
+
+class Man_pager(object):
+    _ptn_overstrike: re.Pattern = re.compile(r'.\x08')
+
+    def __init__(self):
+        self._buf: bytes | mmap.mmap = b''
+        self._offsets: array.array = array.array('Q')
+        self._sections: array.array = array.array('Q')
+        self._title: str = ''
+        self._pattern: str = ''
+        self._layout: Man_layout = Man_layout()
+        self._wrap: bool = False
+        return
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @property
+    def nlines(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def sections(self) -> array.array:
+        return self._sections
+
+    @property
+    def layout(self) -> Man_layout:
+        return self._layout
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, n: int) -> str:
+        return self.line(n)
+
+    def init(self, buf: bytes | mmap.mmap, title: str = '', digest: str = ''):
+        self._buf = buf
+        self._title = title
+        offsets: array.array = array.array('Q')
+        sections: array.array = array.array('Q')
+        pos: int = 0
+        size: int = len(buf)
+        while pos < size:
+            offsets.append(pos)
+            c: int = buf[pos]
+            if c not in (0x20, 0x09, 0x0a):
+                sections.append(len(offsets) - 1)
+            nl: int = buf.find(b'\n', pos)
+            if nl == -1:
+                break
+            pos = nl + 1
+        self._offsets = offsets
+        self._sections = sections
+        self._layout = Man_layout()
+        self._layout.init(self, digest)
+        return
+
+    def line(self, n: int) -> str:
+        start: int = self._offsets[n]
+        end: int = self._offsets[n + 1] - 1 if n + 1 < len(self._offsets) \
+            else len(self._buf)
+        if end > start and self._buf[end - 1:end] == b'\r':
+            end -= 1
+        s: str = bytes(self._buf[start:end]).decode('UTF-8', errors='replace')
+        if '\x08' in s:
+            s = self._ptn_overstrike.sub('', s)
+        return s.expandtabs(8)
+
+    def lineno(self, bytepos: int) -> int:
+        return bisect.bisect_right(self._offsets, bytepos) - 1
+
+    def find(self, pattern: str, fromline: int, backward: bool = False) -> int:
+        if pattern == '' or self.nlines == 0:
+            return -1
+        self._pattern = pattern
+        ptn: re.Pattern = re.compile(re.escape(pattern.encode('UTF-8')),
+                                     re.IGNORECASE)
+        if backward != True:
+            start: int = self._offsets[min(fromline, self.nlines - 1)]
+            reobj = ptn.search(self._buf, start)
+            return -1 if reobj == None else self.lineno(reobj.start())
+        end: int = self._offsets[fromline] if fromline < self.nlines else len(self._buf)
+        last: int = -1
+        for reobj in ptn.finditer(self._buf, 0, end):
+            last = reobj.start()
+        return -1 if last == -1 else self.lineno(last)
+
+    def next_section(self, fromline: int, backward: bool = False) -> int:
+        if backward:
+            i: int = bisect.bisect_left(self._sections, fromline) - 1
+            return self._sections[i] if i >= 0 else -1
+        i = bisect.bisect_right(self._sections, fromline)
+        return self._sections[i] if i < len(self._sections) else -1
+
+    def find_section(self, name: str) -> int:
+        low: str = name.strip().lower()
+        if low == '':
+            return -1
+        for n in self._sections:
+            if self.line(n).strip().lower().startswith(low):
+                return n
+        return -1
+
+    def _totalrows(self, width: int) -> int:
+        if self._wrap:
+            return self._layout.rows(width)[-1]
+        return self.nlines
+
+    def _rowof(self, n: int, width: int) -> int:
+        return self._layout.rows(width)[n] if self._wrap else n
+
+    def _lineof(self, top: int, width: int) -> int:
+        return self._layout.row_to_line(top, width) if self._wrap else top
+
+    def _screenrows(self, top: int, height: int, width: int) -> list:
+        retlist: list = list()
+        n: int = self._lineof(top, width)
+        skip: int = top - self._rowof(n, width) if self._wrap else 0
+        while len(retlist) < height and n < self.nlines:
+            s: str = self.line(n)
+            if self._wrap != True:
+                retlist.append(Man_layout.clip(s, width))
+            else:
+                starts: list = Man_layout.split_rows(s, width)
+                for i in range(skip, len(starts)):
+                    end: int = starts[i + 1] if i + 1 < len(starts) else len(s)
+                    retlist.append(s[starts[i]:end])
+                skip = 0
+            n += 1
+        return retlist[:height]
+
+    def _prompt(self, stdscr, label: str) -> str:
+        rows, cols = stdscr.getmaxyx()
+        chars: list = list()
+        curses.curs_set(1)
+        while True:
+            s: str = Man_layout.clip(label + ''.join(chars), cols - 1)
+            stdscr.move(rows - 1, 0)
+            stdscr.clrtoeol()
+            stdscr.addstr(rows - 1, 0, s)
+            stdscr.refresh()
+            try:
+                c = stdscr.get_wch()
+            except curses.error:
+                continue
+            if c in ('\n', '\r', curses.KEY_ENTER):
+                break
+            elif c == '\x1b':
+                chars = list()
+                break
+            elif c in ('\x08', '\x7f', curses.KEY_BACKSPACE):
+                if len(chars) >= 1:
+                    chars.pop()
+            elif isinstance(c, str) and c.isprintable():
+                chars.append(c)
+        curses.curs_set(0)
+        return ''.join(chars)
+
+    def _draw(self, stdscr, top: int, message: str):
+        rows, cols = stdscr.getmaxyx()
+        width: int = max(2, cols - 1)
+        stdscr.erase()
+        low: str = self._pattern.lower()
+        for y, s in enumerate(self._screenrows(top, rows - 1, width)):
+            try:
+                stdscr.addstr(y, 0, s)
+                pos: int = s.lower().find(low) if low != '' else -1
+                while pos != -1:
+                    stdscr.addstr(y, Man_layout.strwidth(s[:pos]),
+                                  s[pos:pos + len(low)], curses.A_REVERSE)
+                    pos = s.lower().find(low, pos + len(low))
+            except curses.error:
+                pass
+        if message == '':
+            total: int = self._totalrows(width)
+            percent: int = 100 if total <= rows - 1 else \
+                min(100, (top + rows - 1) * 100 // total)
+            message = '{0}  line {1}/{2} ({3}%)  q:quit /:search n/N ]/[:section s:goto w:wrap'.format(
+                self._title, self._lineof(top, width) + 1, self.nlines, percent)
+        try:
+            stdscr.addstr(rows - 1, 0, Man_layout.clip(message, cols - 1),
+                          curses.A_REVERSE)
+        except curses.error:
+            pass
+        stdscr.refresh()
+        return
+
+    def run(self, stdscr):
+        curses.curs_set(0)
+        top: int = 0
+        message: str = ''
+        pattern: str = ''
+        while True:
+            rows, cols = stdscr.getmaxyx()
+            width: int = max(2, cols - 1)
+            page: int = max(1, rows - 1)
+            maxtop: int = max(0, self._totalrows(width) - page)
+            top = max(0, min(top, maxtop))
+            self._draw(stdscr, top, message)
+            message = ''
+            try:
+                c = stdscr.get_wch()
+            except curses.error:
+                continue
+            n: int = -1
+            cur: int = self._lineof(top, width)
+            if c in ('q', 'Q'):
+                break
+            elif c in ('j', '\n', '\r', 'e', curses.KEY_DOWN, curses.KEY_ENTER):
+                top += 1
+            elif c in ('k', 'y', curses.KEY_UP):
+                top -= 1
+            elif c in (' ', 'f', curses.KEY_NPAGE):
+                top += page
+            elif c in ('b', curses.KEY_PPAGE):
+                top -= page
+            elif c == 'd':
+                top += page // 2
+            elif c == 'u':
+                top -= page // 2
+            elif c in ('g', '<', curses.KEY_HOME):
+                top = 0
+            elif c in ('G', '>', curses.KEY_END):
+                top = maxtop
+            elif c == 'w':
+                self._wrap = self._wrap != True
+                n = cur
+            elif c in ('/', '?'):
+                pattern = self._prompt(stdscr, c)
+                if pattern != '':
+                    n = self.find(pattern, cur + 1 if c == '/' else cur,
+                                  backward=(c == '?'))
+                    message = 'Pattern not found: ' + pattern if n == -1 else ''
+            elif c in ('n', 'N') and pattern != '':
+                n = self.find(pattern, cur + 1 if c == 'n' else cur,
+                              backward=(c == 'N'))
+                message = 'Pattern not found: ' + pattern if n == -1 else ''
+            elif c in (']', '[', '}', '{'):
+                n = self.next_section(cur, backward=(c in ('[', '{')))
+            elif c == 's':
+                name: str = self._prompt(stdscr, 'section: ')
+                n = self.find_section(name)
+                if n == -1 and name != '':
+                    message = 'Section not found: ' + name
+            elif c == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+                n = cur
+                width = max(2, stdscr.getmaxyx()[1] - 1)
+            if n >= 0:
+                top = self._rowof(n, width)
+        return
+
+
+def is_builtinpager_available() -> bool:
+    if curses == None:
+        return False
+    return sys.stdin.isatty() and sys.stdout.isatty()
+
+
+def builtin_pager(text: str = '', fpath: pathlib.Path | None = None, title: str = '',
+                  digest: str = '') -> bool:
+    if is_builtinpager_available() != True:
+        return False
+    locale.setlocale(locale.LC_ALL, '')
+    pager = Man_pager()
+    if fpath == None:
+        pager.init(text.encode('UTF-8'), title, digest)
+        curses.wrapper(pager.run)
+        return True
+    with open(fpath, 'rb') as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            pager.init(b'', title, digest)
+            curses.wrapper(pager.run)
+            return True
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pager.init(mm, title, digest)
+            curses.wrapper(pager.run)
+    return True
@@ -39,7 +39,11 @@
 #     GPL-3 Licence: https://www.gnu.org/licenses/gpl-3.0.html.en
 #     Mike Turkey.com: https://miketurkey.com/
 
-from mman import main_manjpfb
+import sys
 if __name__ == '__main__':
+    from man_complete import is_complete_args, main_complete
+    if is_complete_args(sys.argv):
+        main_complete('manjpfb')
+    from mman import main_manjpfb
     main_manjpfb()
     exit(0)
@@ -51,18 +51,43 @@ import typing
 import pydoc
 import copy
 import gzip
+import zlib
+import codecs
 import hashlib
 import pathlib
 import tempfile
+import threading
+import queue
 import multiprocessing
 import urllib.request
+import http.client
+import urllib.parse
+import posixpath
 if __name__ == '__main__':
-    from man_mother_mary import MmanStdError, Mainfunc, Mmanfunc, Man_cache, Man_pagercache
+    from man_complete import is_complete_args, main_complete
+    from man_pager import is_builtinpager_available, builtin_pager
+    from man_layout import Man_bilingual
+    from man_mother_mary import MmanStdError, Mainfunc, Mmanfunc, Man_cache, Man_cache_validator, \
+        Man_pagercache, Man_hottier, \
+        Man_searchindex, Man_aproposindex, Man_bloomfilter, Man_bktree, \
+        Man_resolver, Man_transport, Man_transport_response, Man_circuitbreaker
 else:
     try:
-        from .man_mother_mary import MmanStdError, Mainfunc, Mmanfunc, Man_cache, Man_pagercache
+        from .man_complete import is_complete_args, main_complete
+        from .man_pager import is_builtinpager_available, builtin_pager
+        from .man_layout import Man_bilingual
+        from .man_mother_mary import MmanStdError, Mainfunc, Mmanfunc, Man_cache, Man_cache_validator, \
+            Man_pagercache, Man_hottier, \
+            Man_searchindex, Man_aproposindex, Man_bloomfilter, Man_bktree, \
+            Man_resolver, Man_transport, Man_transport_response, Man_circuitbreaker
     except:
-        from man_mother_mary import MmanStdError, Mainfunc, Mmanfunc, Man_cache, Man_pagercache
+        from man_complete import is_complete_args, main_complete
+        from man_pager import is_builtinpager_available, builtin_pager
+        from man_layout import Man_bilingual
+        from man_mother_mary import MmanStdError, Mainfunc, Mmanfunc, Man_cache, Man_cache_validator, \
+            Man_pagercache, Man_hottier, \
+            Man_searchindex, Man_aproposindex, Man_bloomfilter, Man_bktree, \
+            Man_resolver, Man_transport, Man_transport_response, Man_circuitbreaker
 
 
 class Opt_http_header(object):
@@ -140,6 +165,9 @@ class Opt_http_header(object):
 class Man_loadurl_getnpdata(typing.NamedTuple):
     data: bytes
     url: str
+    etag: str = ''
+    lastmodified: str = ''
+    notmodified: bool = False
 
     def string(self) -> str:
         return self.data.decode('UTF-8')
@@ -207,21 +235,32 @@ class Man_loadurl(object):
     __slots__ = ['_header_x_mman_enable',
                  '_header_user_agent',
                  '_header_x_mman_roottomlid',
-                 '_header_x_mman_mantomlid', '_urls',
+                 '_header_x_mman_mantomlid',
+                 '_header_if_none_match',
+                 '_header_if_modified_since', '_urls',
                  '_fastestdomain', '_timeout',
                  '_request_starttime',
-                 '_pobjlist']
+                 '_pobjlist', '_hedge_delay',
+                 '_hedge_maxinflight', '_hedge_percentile']
+    _hedge_samples: typing.ClassVar[list] = list()
+    _hedge_samples_max: typing.ClassVar[int] = 64
+    _hedge_samples_min: typing.ClassVar[int] = 8
 
     def __init__(self):
         self._header_x_mman_enable: str = ''
         self._header_user_agent: str = ''
         self._header_x_mman_roottomlid: str = ''
         self._header_x_mman_mantomlid: str = ''
+        self._header_if_none_match: str = ''
+        self._header_if_modified_since: str = ''
         self._urls: tuple[str] = tuple([''])
         self._fastestdomain: str = ''
         self._timeout: float = 10
         self._request_starttime: float = 0.0
         self._pobjlist: tuple = tuple()
+        self._hedge_delay: float = 0.0
+        self._hedge_maxinflight: int = 2
+        self._hedge_percentile: float = 95.0
         return
 
     @property
@@ -240,6 +279,14 @@ class Man_loadurl(object):
     def header_x_mman_mantomlid(self) -> str:
         return self._header_x_mman_mantomlid
 
+    @property
+    def header_if_none_match(self) -> str:
+        return self._header_if_none_match
+
+    @property
+    def header_if_modified_since(self) -> str:
+        return self._header_if_modified_since
+
     @property
     def urls(self) -> tuple[str]:
         return self._urls
@@ -256,6 +303,18 @@ class Man_loadurl(object):
     def request_starttime(self) -> float:
         return self._request_starttime
 
+    @property
+    def hedge_delay(self) -> float:
+        return self._hedge_delay
+
+    @property
+    def hedge_maxinflight(self) -> int:
+        return self._hedge_maxinflight
+
+    @property
+    def hedge_percentile(self) -> float:
+        return self._hedge_percentile
+
     @header_x_mman_enable.setter
     def header_x_mman_enable(self, v: str):
         if isinstance(v, str) != True:
@@ -291,6 +350,22 @@ class Man_loadurl(object):
         self._header_x_mman_mantomlid = v
         return
 
+    @header_if_none_match.setter
+    def header_if_none_match(self, v: str):
+        if isinstance(v, str) != True:
+            errmes: str = 'Error: if-none-match is NOT string type.'
+            raise TypeError(errmes)
+        self._header_if_none_match = v
+        return
+
+    @header_if_modified_since.setter
+    def header_if_modified_since(self, v: str):
+        if isinstance(v, str) != True:
+            errmes: str = 'Error: if-modified-since is NOT string type.'
+            raise TypeError(errmes)
+        self._header_if_modified_since = v
+        return
+
     @urls.setter
     def urls(self, v: list | tuple):
         chklist: list = [isinstance(v, list), isinstance(v, tuple)]
@@ -324,6 +399,40 @@ class Man_loadurl(object):
         self._timeout = v
         return
 
+    @hedge_delay.setter
+    def hedge_delay(self, v: float | int):
+        if isinstance(v, float) != True and isinstance(v, int) != True:
+            errmes: str = 'Error: hedge_delay is NOT float or integer type.'
+            raise TypeError(errmes)
+        if v < 0:
+            errmes = 'Error: hedge_delay is NOT positive. [{0}]'.format(v)
+            raise ValueError(errmes)
+        self._hedge_delay = v
+        return
+
+    @hedge_maxinflight.setter
+    def hedge_maxinflight(self, v: int):
+        if isinstance(v, int) != True:
+            errmes: str = 'Error: hedge_maxinflight is NOT integer type.'
+            raise TypeError(errmes)
+        if v < 1:
+            errmes = 'Error: hedge_maxinflight is less than 1. [{0}]'.format(v)
+            raise ValueError(errmes)
+        self._hedge_maxinflight = v
+        return
+
+    @hedge_percentile.setter
+    def hedge_percentile(self, v: float | int):
+        if isinstance(v, float) != True and isinstance(v, int) != True:
+            errmes: str = 'Error: hedge_percentile is NOT float or integer type.'
+            raise TypeError(errmes)
+        if v <= 0 or v > 100:
+            errmes = 'Error: hedge_percentile is NOT in (0, 100]. [{0}]'.format(
+                v)
+            raise ValueError(errmes)
+        self._hedge_percentile = v
+        return
+
     def _fastesturl(self) -> str:
         if len(self.urls) == 0:
             errmes: str = 'Error: empty Man_loadurl.urls'
@@ -347,6 +456,71 @@ class Man_loadurl(object):
             print(mes)
         return
 
+    def _makeheaders(self) -> dict:
+        headers: dict = dict()
+        chklist: list = [(self.header_x_mman_enable, 'x-mman-enable'),
+                         (self.header_user_agent, 'user-agent'),
+                         (self.header_x_mman_roottomlid, 'x-mman-roottomlid'),
+                         (self.header_x_mman_mantomlid, 'x-mman-mantomlid'),
+                         (self.header_if_none_match, 'if-none-match'),
+                         (self.header_if_modified_since, 'if-modified-since')]
+        for hvalue, hname in chklist:
+            if hvalue != '':
+                headers[hname] = hvalue
+        return headers
+
+    def _makerequest(self, urlpath: str) -> urllib.request.Request:
+        return urllib.request.Request(urlpath, headers=self._makeheaders())
+
+    def _hedgedelay(self) -> float:
+        if self.hedge_delay > 0:
+            return self.hedge_delay
+        samples: list = sorted(Man_loadurl._hedge_samples)
+        if len(samples) < Man_loadurl._hedge_samples_min:
+            return self.timeout / 4
+        idx: int = int(len(samples) * self.hedge_percentile / 100)
+        idx = min(idx, len(samples) - 1)
+        return min(samples[idx], self.timeout)
+
+    @staticmethod
+    def _add_hedgesample(latency: float):
+        samples: list = Man_loadurl._hedge_samples
+        samples.append(latency)
+        if len(samples) > Man_loadurl._hedge_samples_max:
+            del samples[0]
+        return
+
+    def _fetch_hedge(self, urlpath: str, retqueue: queue.Queue):
+        headers: dict = self._makeheaders()
+        html_content: bytes = b''
+        errmes: str = ''
+        etag: str = ''
+        lastmodified: str = ''
+        notmodified: bool = False
+        starttime: float = time.time()
+        try:
+            response: Man_transport_response = Man_transport.request(
+                urlpath, headers, self.timeout)
+            if response.status == 304:
+                notmodified = True
+            elif 200 <= response.status < 300:
+                html_content = response.body
+            else:
+                errmes = 'Error: HTTP Error. {0} {1}, URL: {2}'.format(
+                    response.status, response.reason, urlpath)
+            if html_content != b'' or notmodified:
+                etag = response.headers.get('ETag', '')
+                lastmodified = response.headers.get('Last-Modified', '')
+        except (OSError, http.client.HTTPException) as e:
+            errmes = 'Error: URL Error. {0}, URL: {1}'.format(e, urlpath)
+        except Exception as e:
+            errmes = 'Error: Runtime Error. {0}, URL: {1}'.format(e, urlpath)
+        if html_content != b'' or notmodified:
+            self._add_hedgesample(time.time() - starttime)
+        retqueue.put((urlpath, html_content, errmes,
+                      etag, lastmodified, notmodified))
+        return
+
     def getdata(self, exception: bool = True,
                 chkfc: typing.Callable = lambda x: True if x != b'' else False,
                 retfc: typing.Callable = lambda x: x) -> Man_loadurl_getnpdata:
@@ -360,32 +534,50 @@ class Man_loadurl(object):
             return
         errmes: str = ''
         errmeslist: list = list()
-        for urlpath in urliter(self):
-            request = urllib.request.Request(urlpath)
-            chklist: list = [(self.header_x_mman_enable, 'x-mman-enable'),
-                             (self.header_user_agent, 'user-agent'),
-                             (self.header_x_mman_roottomlid, 'x-mman-roottomlid'),
-                             (self.header_x_mman_mantomlid, 'x-mman-mantomlid')]
-            for hvalue, hname in chklist:
-                if hvalue != '':
-                    request.add_header(hname, hvalue)
-            html_content: bytes = b''
+        urlpaths: typing.Final[tuple] = Man_circuitbreaker.filter_urls(
+            tuple(urliter(self)))
+        retqueue: queue.Queue = queue.Queue()
+        nexturl: int = 0
+        inflight: int = 0
+
+        def launch(self) -> int:
+            func: typing.Callable = self._fetch_hedge
+            args: tuple = (urlpaths[nexturl], retqueue)
+            threading.Thread(target=func, args=args, daemon=True).start()
+            return nexturl + 1
+        nexturl = launch(self)
+        inflight += 1
+        urlpath: str = urlpaths[0]
+        html_content: bytes = b''
+        etag: str = ''
+        lastmodified: str = ''
+        notmodified: bool = False
+        while inflight >= 1:
+            canhedge: bool = nexturl < len(urlpaths) and \
+                inflight < self.hedge_maxinflight
             try:
-                with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                    html_content = response.read()
-                    self._request_starttime = time.time()
-            except urllib.error.URLError as e:
-                errmes = 'Error: URL Error. {0}, URL: {1}'.format(e, urlpath)
-                errmeslist.append(errmes)
-            except urllib.error.HTTPError as e:
-                errmes = 'Error: HTTP Error. {0}, URL: {1}'.format(e, urlpath)
-                errmeslist.append(errmes)
-            except Exception as e:
-                errmes = 'Error: Runtime Error. {0}, URL: {1}'.format(
-                    e, urlpath)
+                t: tuple = retqueue.get(
+                    timeout=self._hedgedelay() if canhedge else None)
+            except queue.Empty:
+                nexturl = launch(self)
+                inflight += 1
+                continue
+            inflight -= 1
+            urlpath, html_content, errmes, etag, lastmodified, notmodified = t
+            if errmes != '':
                 errmeslist.append(errmes)
+            if notmodified:
+                self._request_starttime = time.time()
+                retobj: Man_loadurl_getnpdata = Man_loadurl_getnpdata(
+                    data=b'', url=urlpath, etag=etag,
+                    lastmodified=lastmodified, notmodified=True)
+                return retobj
             if chkfc(html_content):
+                self._request_starttime = time.time()
                 break
+            if nexturl < len(urlpaths) and inflight < self.hedge_maxinflight:
+                nexturl = launch(self)
+                inflight += 1
         if html_content == b'' and len(errmeslist) >= 1 and exception == True:
             errmes = '\n'.join(errmeslist)
             raise MmanStdError(errmes)
@@ -398,16 +590,14 @@ class Man_loadurl(object):
             errmes = 'Error: retfc_content is not bytes type.'
             raise MmanStdError(errmes)
         retobj: Man_loadurl_getnpdata = Man_loadurl_getnpdata(
-            data=retfc_content, url=urlpath)
+            data=retfc_content, url=urlpath, etag=etag,
+            lastmodified=lastmodified)
         return retobj
 
     @staticmethod
     def _loadurl_by_request(request, retqueue, rettype: str, timeout: float):
-        try:
-            with urllib.request.urlopen(request, timeout=timeout) as response:
-                html_content = response.read()
-        except:
-            html_content: bytes = b''
+        html_content: bytes = Man_transport.loadbytes(request.full_url, dict(request.header_items()),
+                                                      timeout, exception=False)
         result: tuple = tuple()
         if rettype == 'bytes':
             result = (request.full_url, html_content)
@@ -427,17 +617,8 @@ class Man_loadurl(object):
                       retfc: typing.Callable[[bytes], bytes] = lambda x: x)\
             -> Man_loadurl_getnpdata:
         timeout: int = 10
-        requests: list = list()
-        for urlpath in self.urls:
-            request = urllib.request.Request(urlpath)
-            chklist: list = [(self.header_x_mman_enable, 'x-mman-enable'),
-                             (self.header_user_agent, 'user-agent'),
-                             (self.header_x_mman_roottomlid, 'x-mman-roottomlid'),
-                             (self.header_x_mman_mantomlid, 'x-mman-mantomlid')]
-            for hvalue, hname in chklist:
-                if hvalue != '':
-                    request.add_header(hname, hvalue)
-            requests.append(request)
+        requests: list = [self._makerequest(urlpath)
+                          for urlpath in Man_circuitbreaker.filter_urls(self.urls)]
         if len(self._pobjlist) >= 1:
             self.close()
         retqueue: multiprocessing.queues.Queue = multiprocessing.Queue()
@@ -502,6 +683,53 @@ class Man_loadurl(object):
 
 
 class Man_roottoml_subroutine(object):
+    @staticmethod
+    def urlpath(url: str) -> str:
+        path: str = urllib.parse.urlsplit(url).path
+        return posixpath.normpath(path)
+
+    @staticmethod
+    def parse_manifest(body: bytes, manifesturl: str) -> dict:
+        subr = Man_roottoml_subroutine
+        if isinstance(body, bytes) != True:
+            errmes: str = 'Error: body is not bytes type.'
+            raise TypeError(errmes)
+        ptn: typing.Final[str] = r'SHA3-256\((.+)\)= ([0-9a-f]{64})'
+        manifest: dict = dict()
+        try:
+            rows: list = body.decode('UTF-8').splitlines()
+        except UnicodeDecodeError:
+            return dict()
+        for row in rows:
+            reobj = re.fullmatch(ptn, row.strip())
+            if reobj == None:
+                continue
+            url: str = urllib.parse.urljoin(manifesturl, reobj.group(1))
+            manifest[subr.urlpath(url)] = reobj.group(2)
+        return manifest
+
+    @staticmethod
+    def patch_mantoml(tomldic: dict, deltadic: dict, hashdg_old: str, hashdg_new: str) -> dict:
+        delta: dict = deltadic.get('delta', dict())
+        if isinstance(delta, dict) != True:
+            return dict()
+        if delta.get('from') != hashdg_old or delta.get('to') != hashdg_new:
+            return dict()
+        remove: list = delta.get('remove', list())
+        upsert: dict = deltadic.get('upsert', dict())
+        if isinstance(remove, list) != True or isinstance(upsert, dict) != True:
+            return dict()
+        for k in remove:
+            tomldic.pop(k, None)
+        for k, v in upsert.items():
+            if isinstance(v, dict) and isinstance(tomldic.get(k), dict):
+                entry: dict = dict(tomldic[k])
+                entry.update(v)
+                tomldic[k] = entry
+            else:
+                tomldic[k] = v
+        return tomldic
+
     @staticmethod
     def get_hashdg_url(roottomlurl_sha3: str) -> str:
         mainfunc = Mainfunc
@@ -545,6 +773,7 @@ class Man_roottoml(object):
          116, 117, 114, 107, 101, 121, 46, 99, 111, 109)]
     __root_dir: typing.Final[str] = '/clidirs/man{0}/{1}/'
     __root_name: typing.Final[str] = 'root.toml.gz'
+    __manifest_name: typing.Final[str] = 'CHECKSUM.SHA3-256'
     __root_dir_suffixes: typing.Final[dict] = {
         ('fb', 'jpn', 'arm64'): 'jpfb',
         ('fb', 'eng', 'arm64'): 'enfb',
@@ -565,6 +794,9 @@ class Man_roottoml(object):
         self.og_cmdname: str = ''
         self.og_cmdversion: str = ''
         self.og_cmddate: str = ''
+        self.og_cachebackend: str = 'file'
+        self.og_loadmantoml: bool = True
+        self.og_hashonly_mantoml: bool = False
         self._og_http_header: Opt_http_header = Opt_http_header()
         self._status: str = ''
         self._thedate: str = ''
@@ -579,6 +811,9 @@ class Man_roottoml(object):
         self._roottomlurl: str = ''
         self._rootdic: dict = dict()
         self._mantomlurls: list = list()
+        self._manifest: dict = dict()
+        self._releaseindex: dict = dict()
+        self._mantomlhashdg: str = ''
         return
 
     @property
@@ -621,6 +856,14 @@ class Man_roottoml(object):
     def fastestdomain(self) -> str:
         return self._fastestdomain
 
+    @property
+    def releaseindex(self) -> dict:
+        return self._releaseindex
+
+    @property
+    def mantomlhashdg(self) -> str:
+        return self._mantomlhashdg
+
     @og_http_header.setter
     def og_http_header(self, header: Opt_http_header):
         if isinstance(header, Opt_http_header) != True:
@@ -659,6 +902,52 @@ class Man_roottoml(object):
         roottomlurls: list = [func(root_site) for root_site in root_sites]
         return roottomlurls
 
+    def _load_manifest(self, roottomlurls: tuple, cache: Man_cache) -> dict:
+        subr = Man_roottoml_subroutine
+        if cache.get_nomanifest():
+            return dict()
+        manifesturls: list = [url.rsplit('/', 1)[0] + '/' + self.__manifest_name
+                              for url in roottomlurls]
+        loadurl = Man_loadurl()
+        loadurl.header_x_mman_enable = self.og_http_header.x_mman_enable
+        loadurl.header_user_agent = self.og_http_header.user_agent
+        loadurl.timeout = 0.8
+        loadurl.urls = tuple(manifesturls)
+
+        def chkfc(body: bytes) -> bool:
+            return body.startswith(b'SHA3-256(')
+        npdata: Man_loadurl_getnpdata = loadurl.getdata(
+            exception=False, chkfc=chkfc)
+        manifest: dict = subr.parse_manifest(npdata.data, npdata.url)
+        if len(manifest) == 0:
+            cache.store_nomanifest()
+            return dict()
+        self._fastestdomain = npdata.url
+        return manifest
+
+    def _load_roottoml_body(self, roottomlurls: tuple, hashdg: str,
+                            cache: Man_cache) -> tuple[str, str]:
+        self.og_http_header.x_mman_roottomlid = hashdg
+        hit: bool
+        rootstr: str
+        hit, rootstr = cache.get_roottoml(hashdg)
+        if hit:
+            return rootstr, ''
+        loadurl = Man_loadurl()
+        loadurl.header_x_mman_enable = self.og_http_header.x_mman_enable
+        loadurl.header_user_agent = self.og_http_header.user_agent
+        loadurl.header_x_mman_roottomlid = self.og_http_header.x_mman_roottomlid
+        loadurl.timeout = 1.5
+        loadurl.fastestdomain = self.fastestdomain
+        loadurl.urls = tuple(roottomlurls)
+        npdata: Man_loadurl_getnpdata = loadurl.getdata()
+        npdata.compare(hashdg)
+        rootstr = npdata.gzdecompress_string()
+        cache.store_roottoml(hit, npdata.data)
+        cache.store_validator(self.__root_name, hashdg,
+                              npdata.etag, npdata.lastmodified)
+        return rootstr, npdata.url
+
     def _load_roottomlurls(self, roottomlurls: tuple, cache: Man_cache) -> tuple[str, str]:
         mainfunc = Mainfunc
         subr = Man_roottoml_subroutine
@@ -671,6 +960,31 @@ class Man_roottoml(object):
             if url.endswith('toml.gz') != True:
                 errmes = 'Error: Not root.toml.gz file. [{0}]'.format(url)
                 raise MmanStdError(errmes)
+        self._manifest = self._load_manifest(roottomlurls, cache)
+        hashdg_manifest: str = self._manifest.get(
+            subr.urlpath(roottomlurls[0]), '')
+        if hashdg_manifest != '':
+            return self._load_roottoml_body(roottomlurls, hashdg_manifest, cache)
+        validator: Man_cache_validator = cache.get_validator(self.__root_name)
+        prefetch: Man_loadurl_getnpdata = Man_loadurl_getnpdata(
+            data=b'', url='')
+        hit: bool = False
+        rootstr: str = ''
+        if validator.hashdg != '':
+            hit, rootstr = cache.get_roottoml(validator.hashdg)
+        if hit:
+            loadurl = Man_loadurl()
+            loadurl.header_x_mman_enable = self.og_http_header.x_mman_enable
+            loadurl.header_user_agent = self.og_http_header.user_agent
+            loadurl.header_if_none_match = validator.etag
+            loadurl.header_if_modified_since = validator.lastmodified
+            loadurl.timeout = 1.5
+            loadurl.urls = tuple(roottomlurls)
+            prefetch = loadurl.getdata(exception=False)
+            if prefetch.notmodified:
+                self._fastestdomain = prefetch.url
+                self.og_http_header.x_mman_roottomlid = validator.hashdg
+                return rootstr, prefetch.url
         roottomlsha3urls: list = [url + '.SHA3-256' for url in roottomlurls]
         loadurl = Man_loadurl()
         loadurl.header_x_mman_enable = self.og_http_header.x_mman_enable
@@ -690,12 +1004,16 @@ class Man_roottoml(object):
         self._fastestdomain = roottomlurl_sha3
         self.og_http_header.x_mman_roottomlid = hashdg_url
         loadurl.close()
-        hit: bool
-        rootstr: str
         hit, rootstr = cache.get_roottoml(hashdg_url)
         hit = False
         gzbys: bytes = b''
-        if hit != True:
+        if hashlib.new('SHA3-256', prefetch.data).hexdigest() == hashdg_url:
+            roottomlurl: str = prefetch.url
+            gzbys = prefetch.data
+            rootstr = prefetch.gzdecompress_string()
+            validator = Man_cache_validator(hashdg=hashdg_url, etag=prefetch.etag,
+                                            lastmodified=prefetch.lastmodified)
+        elif hit != True:
             loadurl = Man_loadurl()
             loadurl.header_x_mman_enable = self.og_http_header.x_mman_enable
             loadurl.header_user_agent = self.og_http_header.user_agent
@@ -708,24 +1026,19 @@ class Man_roottoml(object):
             roottomlurl: str = npdata.url
             gzbys: bytes = npdata.data
             rootstr = npdata.gzdecompress_string()
+            validator = Man_cache_validator(hashdg=hashdg_url, etag=npdata.etag,
+                                            lastmodified=npdata.lastmodified)
         else:
             roottomlurl = ''
         if debug:
             print('hit of root:', hit)
         cache.store_roottoml(hit, gzbys)
+        if hit != True:
+            cache.store_validator(self.__root_name, validator.hashdg,
+                                  validator.etag, validator.lastmodified)
         return rootstr, roottomlurl
 
-    def _load_mantomlurls(self, mantomlurls: list, cache: Man_cache) -> dict:
-        mainfunc = Mainfunc
-        subr = Man_roottoml_subroutine
-        debug: bool = False
-        if len(mantomlurls) < 1:
-            errmes = 'Error: mantomlurls length is zero.'
-            raise MmanStdError(errmes)
-        for url in mantomlurls:
-            if url.endswith('.toml.gz') != True:
-                errmes = 'Error: url is invalid extension. [{0}]'.format(url)
-                raise MmanStdError(errmes)
+    def _load_mantoml_hashdg(self, mantomlurls: list) -> str:
         mantomlsha3urls: list = [url + '.SHA3-256' for url in mantomlurls]
         loadurl = Man_loadurl()
         loadurl.header_x_mman_enable = self.og_http_header.x_mman_enable
@@ -744,18 +1057,129 @@ class Man_roottoml(object):
             for url in mantomlsha3urls:
                 errmes += '  URL: {0}\n'.format(url)
             raise MmanStdError(errmes)
+        return hashdg_url
+
+    def _load_mantoml_delta(self, mantomlurls: list, hashdg: str, cache: Man_cache) -> dict:
+        subr = Man_roottoml_subroutine
+        hashdg_old: str = cache.get_mantoml_last()
+        hit: bool = False
+        tomldic: dict = dict()
+        if hashdg_old not in ('', hashdg):
+            hit, tomldic = cache.get_index('mantoml', hashdg_old)
+        if not hit:
+            hashdg_old, tomldic = cache.get_mantoml_base()
+        if hashdg_old in ('', hashdg) or len(tomldic) == 0:
+            return dict()
+        deltaname: str = 'delta/{0}-{1}.toml.gz'.format(hashdg_old, hashdg)
+        deltaurls: list = [url.rsplit('/', 1)[0] + '/' + deltaname
+                           for url in mantomlurls]
+        hashdg_delta: str = self._manifest.get(subr.urlpath(deltaurls[0]), '')
+        if hashdg_delta == '' and len(self._manifest) >= 1:
+            return dict()
+        loadurl = Man_loadurl()
+        loadurl.header_x_mman_enable = self.og_http_header.x_mman_enable
+        loadurl.header_user_agent = self.og_http_header.user_agent
+        loadurl.header_x_mman_roottomlid = self.og_http_header.x_mman_roottomlid
+        loadurl.timeout = 0.8
+        loadurl.fastestdomain = self.fastestdomain
+        npdata: Man_loadurl_getnpdata
+        if hashdg_delta == '':
+            loadurl.urls = tuple([url + '.SHA3-256' for url in deltaurls])
+            sha3chkfc: typing.Callable = Man_loadurl_chkretfc.chkfc_hashdgsha3
+            sha3retfc: typing.Callable = Man_loadurl_chkretfc.retfc_hashdgsha3
+            npdata = loadurl.getdata(
+                exception=False, chkfc=sha3chkfc, retfc=sha3retfc)
+            hashdg_delta = npdata.string()
+            if hashdg_delta == '':
+                return dict()
+        loadurl.urls = tuple(deltaurls)
+        npdata = loadurl.getdata(exception=False)
+        if hashlib.new('SHA3-256', npdata.data).hexdigest() != hashdg_delta:
+            return dict()
+        try:
+            deltadic: dict = tomllib.loads(npdata.gzdecompress_string())
+        except (OSError, EOFError, UnicodeDecodeError, tomllib.TOMLDecodeError):
+            return dict()
+        return subr.patch_mantoml(tomldic, deltadic, hashdg_old, hashdg)
+
+    def _load_mantomlurls(self, mantomlurls: list, cache: Man_cache) -> dict:
+        mainfunc = Mainfunc
+        subr = Man_roottoml_subroutine
+        if len(mantomlurls) < 1:
+            errmes = 'Error: mantomlurls length is zero.'
+            raise MmanStdError(errmes)
+        for url in mantomlurls:
+            if url.endswith('.toml.gz') != True:
+                errmes = 'Error: url is invalid extension. [{0}]'.format(url)
+                raise MmanStdError(errmes)
+        mantomlfname: typing.Final[str] = mantomlurls[0].rsplit('/', 1)[-1]
+        hashdg_url: str = self._manifest.get(subr.urlpath(mantomlurls[0]), '')
+        prefetch: Man_loadurl_getnpdata = Man_loadurl_getnpdata(
+            data=b'', url='')
+        hit: bool = False
+        mantomlstr: str = ''
+        if hashdg_url == '':
+            validator: Man_cache_validator = cache.get_validator(mantomlfname)
+            if validator.hashdg != '':
+                hit, mantomlstr = cache.get_mantoml(
+                    mantomlurls[0], validator.hashdg)
+            if hit:
+                loadurl = Man_loadurl()
+                loadurl.header_x_mman_enable = self.og_http_header.x_mman_enable
+                loadurl.header_user_agent = self.og_http_header.user_agent
+                loadurl.header_x_mman_roottomlid = self.og_http_header.x_mman_roottomlid
+                loadurl.header_if_none_match = validator.etag
+                loadurl.header_if_modified_since = validator.lastmodified
+                loadurl.timeout = 0.8
+                loadurl.fastestdomain = self.fastestdomain
+                loadurl.urls = tuple(mantomlurls)
+                prefetch = loadurl.getdata(exception=False)
+                if prefetch.notmodified:
+                    self.og_http_header.x_mman_mantomlid = validator.hashdg
+                    self._mantomlhashdg = validator.hashdg
+                    if self.og_hashonly_mantoml:
+                        return dict()
+                    tomldic = self._parse_mantoml(
+                        validator.hashdg, mantomlstr, cache)
+                    return copy.copy(tomldic)
+            hashdg_url = self._load_mantoml_hashdg(mantomlurls)
         ptn: str = r'[0-9a-f]{64}$'
         if re.match(ptn, hashdg_url) == None:
             errmes = 'Error: hashdg_url is NOT hashdg. [{0}]'.format(
                 hashdg_url)
             raise MmanStdError(errmes)
         self.og_http_header.x_mman_mantomlid = hashdg_url
-        gzbys: bytes = b''
+        self._mantomlhashdg = hashdg_url
+        if self.og_hashonly_mantoml:
+            return dict()
+        return self._load_mantoml_body(mantomlurls, hashdg_url, prefetch, cache)
+
+    def _load_mantoml_body(self, mantomlurls: list, hashdg_url: str,
+                           prefetch: Man_loadurl_getnpdata, cache: Man_cache) -> dict:
+        debug: bool = False
+        mantomlfname: typing.Final[str] = mantomlurls[0].rsplit('/', 1)[-1]
         mantomlstr: str = ''
-        tomldic: dict = dict()
+        gzbys: bytes = b''
         hit: bool = False
+        tomldic: dict = dict()
+        hit, tomldic = cache.get_index('mantoml', hashdg_url)
+        if hit:
+            cache.store_mantoml_last(hashdg_url)
+            return copy.copy(tomldic)
         hit, mantomlstr = cache.get_mantoml(mantomlurls[0], hashdg_url)
         if not hit:
+            tomldic = self._load_mantoml_delta(mantomlurls, hashdg_url, cache)
+        if len(tomldic) >= 1:
+            cache.store_index('mantoml', hashdg_url, tomldic)
+            cache.store_mantoml_base(hashdg_url, tomldic)
+            cache.store_mantoml_last(hashdg_url)
+            return copy.copy(tomldic)
+        if not hit and hashlib.new('SHA3-256', prefetch.data).hexdigest() == hashdg_url:
+            gzbys = prefetch.data
+            mantomlstr = prefetch.gzdecompress_string()
+            cache.store_validator(mantomlfname, hashdg_url,
+                                  prefetch.etag, prefetch.lastmodified)
+        elif not hit:
             loadurl = Man_loadurl()
             loadurl.header_x_mman_enable = self.og_http_header.x_mman_enable
             loadurl.header_user_agent = self.og_http_header.user_agent
@@ -769,18 +1193,64 @@ class Man_roottoml(object):
             mantoml.compare(hashdg_url)
             gzbys: bytes = mantoml.data
             mantomlstr: str = mantoml.gzdecompress_string()
+            cache.store_validator(mantomlfname, hashdg_url,
+                                  mantoml.etag, mantoml.lastmodified)
         if debug:
             print('hit of man.toml.gz:', hit)
             print('mantomlurl:', mantomlurls[0])
         cache.store_mantoml(hit, mantomlurls[0], gzbys)
-        tomldic = tomllib.loads(mantomlstr)
+        tomldic = self._parse_mantoml(hashdg_url, mantomlstr, cache)
         return copy.copy(tomldic)
 
-    def make(self):
+    @staticmethod
+    def _parse_mantoml(hashdg: str, mantomlstr: str, cache: Man_cache) -> dict:
+        hit: bool
+        tomldic: dict
+        hit, tomldic = cache.get_index('mantoml', hashdg)
+        if not hit:
+            tomldic = tomllib.loads(mantomlstr)
+            cache.store_index('mantoml', hashdg, tomldic)
+            cache.store_mantoml_base(hashdg, tomldic)
+        cache.store_mantoml_last(hashdg)
+        return tomldic
+
+    def _load_releaseindex(self, rootdic: dict, cache: Man_cache) -> dict:
         mainfunc = Mainfunc
+        hashdg: str = ''
+        if self.og_roottomlfpath == '':
+            hashdg = self.og_http_header.x_mman_roottomlid
+        hit: bool = False
+        relindex: dict = dict()
+        if hashdg != '':
+            hit, relindex = cache.get_index('release', hashdg)
+        if hit:
+            return relindex
+        relindex = mainfunc.make_releaseindex(rootdic)
+        if hashdg != '':
+            cache.store_index('release', hashdg, relindex)
+        return relindex
+
+    def _makecache(self) -> Man_cache:
         cache = Man_cache()
         cache.init(self.og_manenv_os2, self.og_manenv_lang, self.og_manenv_arch,
                    self.og_cmdversion, self.og_cmddate)
+        cache.set_backend(self.og_cachebackend)
+        return cache
+
+    def load_mantoml(self) -> dict:
+        if self.mantomlhashdg == '':
+            errmes: str = 'Error: Not resolved man.toml hashdg.'
+            raise MmanStdError(errmes)
+        cache: Man_cache = self._makecache()
+        prefetch: Man_loadurl_getnpdata = Man_loadurl_getnpdata(
+            data=b'', url='')
+        tomldic: dict = self._load_mantoml_body(self._mantomlurls, self.mantomlhashdg,
+                                                prefetch, cache)
+        return copy.copy(tomldic)
+
+    def make(self):
+        mainfunc = Mainfunc
+        cache = self._makecache()
         enable_cache: bool = True
         if len(self.og_cache_rooturls) >= 1 and enable_cache == True:
             tmplist: list = self._getrooturl(
@@ -833,8 +1303,13 @@ class Man_roottoml(object):
         url: str
         tpl: tuple
         vernamekey: str = ''
+        if self.og_loadmantoml != True:
+            self._releaseindex = self._load_releaseindex(rootdic, cache)
+            return dict()
         if self.og_manhashfpath == '':
-            tpl = mainfunc.geturlpath_man(self._rootdic, self.og_vernamekey)
+            self._releaseindex = self._load_releaseindex(rootdic, cache)
+            tpl = mainfunc.lookup_releaseindex(
+                self._releaseindex, self.og_vernamekey)
             self._mantomlurls, self._osname, self._status, self._thedate, vernamekey = tpl
             tomldic: dict = self._load_mantomlurls(self._mantomlurls, cache)
         else:
@@ -846,6 +1321,7 @@ class Man_roottoml(object):
 class Man_mantoml_retmake(typing.NamedTuple):
     pagerurls: tuple
     hashdg: str
+    fname: str = ''
 
 
 class Man_mantoml(object):
@@ -978,9 +1454,7 @@ class Man_mantoml(object):
             print('  v:', v)
         return
 
-    def make(self) -> list[tuple]:
-        retempty: Man_mantoml_retmake = Man_mantoml_retmake(
-            pagerurls=tuple(), hashdg='')
+    def _make_fnameurldic(self) -> dict:
         self.vcheck_og_tomldic()
         self.vcheck_og_osname_root()
         self.vcheck_og_mannum()
@@ -1007,38 +1481,70 @@ class Man_mantoml(object):
             pagerurls: list = [inloop1(baseurl, hashdg, fname_new)
                                for baseurl in self.og_baseurls]
             np: Man_mantoml_retmake = Man_mantoml_retmake(
-                pagerurls=tuple(pagerurls), hashdg=hashdg)
+                pagerurls=tuple(pagerurls), hashdg=hashdg, fname=fname)
             fnameurldic[fname] = np
         if self.og_osname_root != self.osname:
             errmes = 'Error: Mismatch OSNAME. [{0}, {1}]'.format(
                 self.og_osname_root, self.osname)
             raise MmanStdError(errmes)
-        fnameurldictkeys: list
+        return fnameurldic
+
+    def _make_fnames(self) -> list[str]:
         if self.og_mannum != '':
-            fnameurldictkeys = [self.og_manname + '.' + self.og_mannum]
-        else:
-            fnameurldictkeys = ['{0}.{1}'.format(
-                self.og_manname, i) for i in range(1, 10)]
-        for fname in fnameurldictkeys:
+            return [self.og_manname + '.' + self.og_mannum]
+        return ['{0}.{1}'.format(self.og_manname, i) for i in range(1, 10)]
+
+    def make(self) -> list[tuple]:
+        retempty: Man_mantoml_retmake = Man_mantoml_retmake(
+            pagerurls=tuple(), hashdg='')
+        fnameurldic: typing.Final[dict] = self._make_fnameurldic()
+        retnp: Man_mantoml_retmake = retempty
+        for fname in self._make_fnames():
             retnp: Man_mantoml_retmake = fnameurldic.get(fname, retempty)
             if retnp != retempty:
                 break
         return retnp
 
+    def make_all(self) -> list[Man_mantoml_retmake]:
+        fnameurldic: typing.Final[dict] = self._make_fnameurldic()
+        return [fnameurldic[fname] for fname in self._make_fnames()
+                if fname in fnameurldic]
+
 
 class Np_getstring_pagerurl(typing.NamedTuple):
     pagerstr: str
     gzbys: bytes
 
 
+class Np_pagerjob(typing.NamedTuple):
+    manpg: Man_mantoml_retmake
+    cache: Man_cache
+    pcache: Man_pagercache
+    http_header: Opt_http_header
+    fastestdomain: str
+
+
 class _Main_man(object):
+    _searchindexes: dict = dict()
+    _searchindex_lock: threading.Lock = threading.Lock()
+    _searchindex_checked: float = 0.0
+    searchindex_revalidate: float = 60.0
+    render_version: typing.Final[int] = 1
+    _punctuation_dashes: typing.Final[tuple] = ('\u2011', '\u2012', '\u2013')
+    _bilingual_os2: typing.Final[tuple] = ('fb',)
+
     @staticmethod
     def enable_terminal() -> tuple[bool | None, str]:
         rettrue: typing.Final[tuple] = (True, '')
         retnone: typing.Final[tuple] = (None, '')
         if sys.platform in ['darwin', 'win32']:
             return rettrue
-        ttyname: str = os.ttyname(sys.stdout.fileno())
+        if sys.stdout.isatty() != True:
+            return rettrue
+        try:
+            ttyname: str = os.ttyname(sys.stdout.fileno())
+        except OSError:
+            return retnone
         if sys.platform.startswith('freebsd'):
             if ttyname.startswith('/dev/pts'):
                 return rettrue
@@ -1062,8 +1568,67 @@ class _Main_man(object):
 
     @staticmethod
     def norm_punctuation(pagerstr: str) -> str:
-        ptn = r'[\u2011]|[\u2012]|[\u2013]'
-        return re.sub(ptn, '-', pagerstr)
+        s: str = pagerstr
+        for c in _Main_man._punctuation_dashes:
+            s = s.replace(c, '-')
+        return s
+
+    @staticmethod
+    def make_normform() -> str:
+        if sys.platform == 'darwin':
+            return 'NFD'
+        elif sys.platform == 'win32':
+            return 'NFC'
+        return 'none'
+
+    @staticmethod
+    def render_pager(pagerstr: str, normform: str) -> str:
+        s: str = pagerstr
+        if normform in ('NFD', 'NFC'):
+            s = unicodedata.normalize(normform, s)
+        return _Main_man.norm_punctuation(s)
+
+    @staticmethod
+    def iter_textchunks(s: str, chunksize: int = 65536) -> typing.Iterator[str]:
+        for i in range(0, len(s), chunksize):
+            yield s[i:i + chunksize]
+
+    @staticmethod
+    def iter_gzipchunks(gzbys: bytes, normform: str, chunksize: int = 65536) -> typing.Iterator[str]:
+        subr = _Main_man
+        dobj = zlib.decompressobj(wbits=31)
+        decoder = codecs.getincrementaldecoder('UTF-8')()
+        view: typing.Final[memoryview] = memoryview(gzbys)
+        rest: str = ''
+        for i in range(0, len(view), chunksize):
+            pending: bytes | memoryview = view[i:i + chunksize]
+            bys: bytes = b''
+            while len(pending) >= 1:
+                bys += dobj.decompress(pending)
+                if dobj.eof != True:
+                    break
+                pending = dobj.unused_data
+                dobj = zlib.decompressobj(wbits=31)
+            s: str = rest + decoder.decode(bys)
+            cut: int = s.rfind('\n') + 1
+            rest = s[cut:]
+            if cut >= 1:
+                yield subr.render_pager(s[:cut], normform)
+        rest += decoder.decode(dobj.flush(), final=True)
+        if rest != '':
+            yield subr.render_pager(rest, normform)
+
+    @staticmethod
+    def write_stdout(chunks: typing.Iterable[str]):
+        try:
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            devnull: int = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            os.close(devnull)
+        return
 
     @staticmethod
     def show_license(os2: str, lang: str, arch: str, mman: bool = False):
@@ -1077,8 +1642,25 @@ class _Main_man(object):
         exit(0)
 
     @staticmethod
-    def show_listman_n(secnum: int, vernamekey: str, os2: str, lang: str, arch: str, gui: bool, cache: Man_cache,
-                       cmdversion: str, cmddate: str) -> str | None:
+    def make_listman(tomldic: dict) -> dict:
+        listman: dict = {'all': list()}
+        listman.update({str(i): list() for i in range(1, 10)})
+        for k, v in tomldic.items():
+            if isinstance(v, dict) != True:
+                continue
+            name, sep, secnum = k.rpartition('.')
+            if sep != '' and len(secnum) == 1 and secnum in listman:
+                listman[secnum].append(name)
+                listman['all'].append(name)
+            else:
+                listman['all'].append(k)
+        for names in listman.values():
+            names.sort()
+        return listman
+
+    @staticmethod
+    def make_roottomlobj_latest(os2: str, lang: str, arch: str, cache: Man_cache,
+                                cmdversion: str, cmddate: str) -> Man_roottoml:
         mmanfunc = Mmanfunc
         http_header: Opt_http_header = Opt_http_header()
         http_header.x_mman_enable = 'YES'
@@ -1093,88 +1675,246 @@ class _Main_man(object):
         roottomlobj.og_manenv_arch = arch
         roottomlobj.og_cmdversion = cmdversion
         roottomlobj.og_cmddate = cmddate
+        roottomlobj.og_cachebackend = cache.backend.name
         roottomlobj.og_rooturls = cache.load_rooturls()
         roottomlobj.og_http_header = http_header
-        tomldic: typing.Final[dict] = roottomlobj.make()
+        return roottomlobj
 
-        def inloop(name: str, secnum: int) -> str:
-            ptns = ('.1', '.2', '.3', '.4', '.5', '.6', '.7', '.8', '.9')
-            ptn: str = ptns[secnum - 1]
-            if name.endswith(ptn):
-                return name.removesuffix(ptn)
-            return ''
-        mannames = [inloop(name, secnum) for name,
-                    d in tomldic.items() if isinstance(d, dict) == True]
-        mannames = [name for name in mannames if name != '']
-        mannames.sort()
+    @staticmethod
+    def load_listman(section: str, os2: str, lang: str, arch: str, cache: Man_cache,
+                     cmdversion: str, cmddate: str) -> pathlib.Path:
+        roottomlobj: Man_roottoml = _Main_man.make_roottomlobj_latest(
+            os2, lang, arch, cache, cmdversion, cmddate)
+        roottomlobj.og_hashonly_mantoml = True
+        roottomlobj.make()
+        hashdg: typing.Final[str] = roottomlobj.mantomlhashdg
+        hit: bool
+        fpath: pathlib.Path
+        hit, fpath = cache.get_listman(hashdg, section)
+        if hit:
+            return fpath
+        tomldic: typing.Final[dict] = roottomlobj.load_mantoml()
+        cache.store_listman(hashdg, _Main_man.make_listman(tomldic))
+        _Main_man.store_complete(cache, tomldic)
+        hit, fpath = cache.get_listman(hashdg, section)
+        return fpath
+
+    @staticmethod
+    def print_listman(fpath: pathlib.Path, gui: bool) -> str | None:
         if gui:
-            tmplist: list = [name for name in mannames]
-            return '\n'.join(tmplist)
-        for name in mannames:
-            print(name)
+            with open(fpath, 'rt', encoding='UTF-8') as fp:
+                s: str = fp.read()
+            return s.rstrip('\n')
+        sys.stdout.flush()
+        with open(fpath, 'rb') as fp:
+            shutil.copyfileobj(fp, sys.stdout.buffer, 1024 * 1024)
+        sys.stdout.flush()
         exit(0)
 
+    @staticmethod
+    def show_listman_n(secnum: int, vernamekey: str, os2: str, lang: str, arch: str, gui: bool, cache: Man_cache,
+                       cmdversion: str, cmddate: str) -> str | None:
+        subr = _Main_man
+        fpath: pathlib.Path = subr.load_listman(str(secnum), os2, lang, arch, cache,
+                                                cmdversion, cmddate)
+        return subr.print_listman(fpath, gui)
+
     @staticmethod
     def show_listman(vernamekey: str, os2: str, lang: str, arch: str, gui: bool, cache: Man_cache,
                      cmdversion: str, cmddate: str) -> str | None:
+        subr = _Main_man
+        fpath: pathlib.Path = subr.load_listman('all', os2, lang, arch, cache,
+                                                cmdversion, cmddate)
+        return subr.print_listman(fpath, gui)
+
+    @staticmethod
+    def _revalidate_searchindex(*args):
+        try:
+            _Main_man._build_searchindex(*args)
+        except (MmanStdError, OSError):
+            pass
+        finally:
+            _Main_man._searchindex_lock.release()
+        return
+
+    @staticmethod
+    def load_searchindex(os2: str, lang: str, arch: str, cache: Man_cache,
+                         cmdversion: str, cmddate: str, lazy: bool = False) -> Man_searchindex:
+        subr = _Main_man
+        if lazy != True:
+            return subr._build_searchindex(os2, lang, arch, cache, cmdversion, cmddate)
+        searchindex: Man_searchindex | None = next(
+            iter(subr._searchindexes.values()), None)
+        hashdg: typing.Final[str] = cache.get_mantoml_last() if searchindex == None else ''
+        if hashdg != '':
+            hit, keys = cache.get_index('search', hashdg)
+            if hit and isinstance(keys, list):
+                searchindex = Man_searchindex()
+                searchindex.init(keys)
+                subr._searchindexes = {hashdg: searchindex}
+        if searchindex == None:
+            subr._searchindex_checked = time.monotonic()
+            return subr._build_searchindex(os2, lang, arch, cache, cmdversion, cmddate)
+        now: typing.Final[float] = time.monotonic()
+        if now - subr._searchindex_checked >= subr.searchindex_revalidate and \
+                subr._searchindex_lock.acquire(blocking=False):
+            subr._searchindex_checked = now
+            args: tuple = (os2, lang, arch, cache, cmdversion, cmddate)
+            threading.Thread(target=subr._revalidate_searchindex, args=args,
+                             daemon=True).start()
+        return searchindex
+
+    @staticmethod
+    def _build_searchindex(os2: str, lang: str, arch: str, cache: Man_cache,
+                           cmdversion: str, cmddate: str) -> Man_searchindex:
+        roottomlobj: Man_roottoml = _Main_man.make_roottomlobj_latest(
+            os2, lang, arch, cache, cmdversion, cmddate)
+        roottomlobj.og_hashonly_mantoml = True
+        roottomlobj.make()
+        hashdg: typing.Final[str] = roottomlobj.mantomlhashdg
+        searchindex: Man_searchindex | None = _Main_man._searchindexes.get(hashdg)
+        if searchindex != None:
+            return searchindex
+        hit: bool
+        keys: list
+        hit, keys = cache.get_index('search', hashdg)
+        if hit != True or isinstance(keys, list) != True:
+            tomldic: typing.Final[dict] = roottomlobj.load_mantoml()
+            keys = [k for k, v in tomldic.items() if isinstance(v, dict)]
+            cache.store_index('search', hashdg, keys)
+        searchindex = Man_searchindex()
+        searchindex.init(keys)
+        _Main_man._searchindexes = {hashdg: searchindex}
+        return searchindex
+
+    @staticmethod
+    def show_search(pattern: str, os2: str, lang: str, arch: str, gui: bool, cache: Man_cache,
+                    cmdversion: str, cmddate: str) -> str | None:
+        searchindex: Man_searchindex = _Main_man.load_searchindex(
+            os2, lang, arch, cache, cmdversion, cmddate, lazy=gui)
+        names: list = list()
+        for k in searchindex.search(pattern):
+            name, sep, secnum = k.rpartition('.')
+            if sep != '' and len(secnum) == 1 and secnum.isdigit():
+                names.append('{0}({1})'.format(name, secnum))
+            else:
+                names.append(k)
+        if gui:
+            return '\n'.join(names)
+        if len(names) == 0:
+            errmes: str = 'Error: Not found the manual name. [{0}]'.format(
+                pattern)
+            raise MmanStdError(errmes)
+        [print(s) for s in names]
+        exit(0)
+
+    @staticmethod
+    def store_bloom(cache: Man_cache, hashdg: str, tomldic: dict):
+        keys: list = [k for k, v in tomldic.items() if isinstance(v, dict)]
+        bloom = Man_bloomfilter()
+        bloom.init(len(keys) * 2)
+        for k in keys:
+            bloom.add(k)
+            bloom.add(k.rpartition('.')[0] if '.' in k else k)
+        cache.store_bloom_latest(hashdg, bloom)
+        return
+
+    @staticmethod
+    def store_complete(cache: Man_cache, tomldic: dict):
         mmanfunc = Mmanfunc
-        http_header: Opt_http_header = Opt_http_header()
-        http_header.x_mman_enable = 'YES'
-        http_header.user_agent = mmanfunc.createstr_cmdname(
-            os2, lang, arch) + '/{0}'.format(cmdversion)
-        roottomlobj = Man_roottoml()
-        roottomlobj.og_vernamekey = '@LATEST-RELEASE'
-        roottomlobj.og_manhashfpath = ''
-        roottomlobj.og_roottomlfpath = ''
-        roottomlobj.og_manenv_os2 = os2
-        roottomlobj.og_manenv_lang = lang
-        roottomlobj.og_manenv_arch = arch
-        roottomlobj.og_cmdversion = cmdversion
-        roottomlobj.og_cmddate = cmddate
-        roottomlobj.og_rooturls = cache.load_rooturls()
-        roottomlobj.og_http_header = http_header
-        tomldic: typing.Final[dict] = roottomlobj.make()
-
-        def inloop(name: str) -> str:
-            ptns = ('.1', '.2', '.3', '.4', '.5', '.6', '.7', '.8', '.9')
-            for ptn in ptns:
-                if name.endswith(ptn):
-                    return name.removesuffix(ptn)
-            return name
-        mannames = [inloop(name) for name, d in tomldic.items()
-                    if isinstance(d, dict) == True]
-        mannames.sort()
+        names: list = sorted(set([k.rpartition('.')[0] if '.' in k else k
+                                  for k, v in tomldic.items() if isinstance(v, dict)]))
+        cmdname: str = mmanfunc.createstr_cmdname(
+            cache.og_os2, cache.og_lang, cache.og_arch)
+        cache.store_complete(cmdname, names)
+        return
+
+    @staticmethod
+    def is_missing_manname(cache: Man_cache, mannum: str, manname: str) -> bool:
+        if mannum not in ('', '1', '2', '3', '4', '5', '6', '7', '8', '9'):
+            return False
+        hashdg: str
+        bloom: Man_bloomfilter | None
+        hashdg, bloom = cache.get_bloom_latest()
+        if bloom == None or hashdg != cache.get_mantoml_last():
+            return False
+        key: str = manname + '.' + mannum if mannum != '' else manname
+        return key not in bloom
+
+    @staticmethod
+    def suggest_mannames(cache: Man_cache, hashdg: str, manname: str,
+                         tomldic: dict | None = None) -> list:
+        hit: bool = False
+        obj: list = list()
+        cacheable: typing.Final[bool] = re.fullmatch(r'[0-9a-f]{64}', hashdg) != None
+        if cacheable != True and tomldic == None:
+            return list()
+        if cacheable:
+            hit, obj = cache.get_index('bktree', hashdg)
+        if hit and isinstance(obj, list):
+            bktree: Man_bktree = Man_bktree.from_obj(obj)
+        else:
+            if tomldic == None:
+                hit, tomldic = cache.get_index('mantoml', hashdg)
+                if hit != True:
+                    return list()
+            names: list = [k.rpartition('.')[0] if '.' in k else k
+                           for k, v in tomldic.items() if isinstance(v, dict)]
+            bktree = Man_bktree()
+            bktree.init(names)
+            if cacheable:
+                cache.store_index('bktree', hashdg, bktree.to_obj())
+        maxdist: int = 1 if len(manname) <= 4 else 2
+        return bktree.search(manname, maxdist)
+
+    @staticmethod
+    def make_notfound_errmes(cache: Man_cache, hashdg: str, manname: str,
+                             tomldic: dict | None = None) -> str:
+        errmes: str = 'Error: Not found the manual name. [{0}]'.format(
+            manname)
+        names: list = _Main_man.suggest_mannames(cache, hashdg, manname, tomldic)
+        if len(names) >= 1:
+            errmes += '\n  Did you mean? ' + ', '.join(names)
+        return errmes
+
+    @staticmethod
+    def index_apropos(cache: Man_cache, fname: str, hashdg: str, pagerstr: str):
+        aproposindex = Man_aproposindex()
+        aproposindex.init(cache.persistdir)
+        try:
+            aproposindex.add(fname, hashdg, pagerstr)
+        except OSError:
+            pass
+        return
+
+    @staticmethod
+    def show_apropos(word: str, gui: bool, cache: Man_cache) -> str | None:
+        aproposindex = Man_aproposindex()
+        aproposindex.init(cache.persistdir)
+        lines: list = list()
+        for k, desc in aproposindex.search(word):
+            name, sep, secnum = k.rpartition('.')
+            s: str = '{0}({1})'.format(name, secnum) if sep != '' else k
+            lines.append(s + ' - ' + desc if desc != '' else s)
         if gui:
-            tmplist: list = [name for name in mannames]
-            return '\n'.join(tmplist)
-        for name in mannames:
-            print(name)
+            return '\n'.join(lines)
+        if len(lines) == 0:
+            errmes: str = 'Error: Not found the keyword in cached man pages. [{0}]'.format(
+                word)
+            raise MmanStdError(errmes)
+        [print(s) for s in lines]
         exit(0)
 
     @staticmethod
     def show_listos(os2: str, lang: str, arch: str, cache: Man_cache,
                     cmdversion: str, cmddate: str):
-        mainfunc = Mainfunc
-        mmanfunc = Mmanfunc
-        http_header: Opt_http_header = Opt_http_header()
-        http_header.x_mman_enable = 'YES'
-        http_header.user_agent = mmanfunc.createstr_cmdname(
-            os2, lang, arch) + '/{0}'.format(cmdversion)
-        roottomlobj = Man_roottoml()
-        roottomlobj.og_vernamekey = '@LATEST-RELEASE'
-        roottomlobj.og_manhashfpath = ''
-        roottomlobj.og_roottomlfpath = ''
-        roottomlobj.og_manenv_os2 = os2
-        roottomlobj.og_manenv_lang = lang
-        roottomlobj.og_manenv_arch = arch
-        roottomlobj.og_cmdversion = cmdversion
-        roottomlobj.og_cmddate = cmddate
-        roottomlobj.og_rooturls = cache.load_rooturls()
-        roottomlobj.og_http_header = http_header
+        roottomlobj: Man_roottoml = _Main_man.make_roottomlobj_latest(
+            os2, lang, arch, cache, cmdversion, cmddate)
+        roottomlobj.og_loadmantoml = False
         roottomlobj.make()
-        rootdic: typing.Final[dict] = roottomlobj._rootdic
-        osnames = [osname for vername, osname, status,
-                   thedate, urls in mainfunc.iter_rootdic(rootdic)]
+        relindex: typing.Final[dict] = roottomlobj.releaseindex
+        osnames = [relindex['releases'][vername]['osname']
+                   for vername in relindex['order']]
         [print(s) for s in osnames]
         exit(0)
 
@@ -1218,6 +1958,113 @@ class _Main_man(object):
         ret: typing.Final = Np_getstring_pagerurl(pagerstr=pagerstr, gzbys=b'')
         return ret
 
+    @staticmethod
+    def resolve_roottoml(cache: Man_cache, os2: str, lang: str, arch: str,
+                         vernamekey: str, manhashfpath: str, version: str,
+                         versiondate: str, uselatest: bool) -> tuple:
+        subr = _Main_man
+        mmanfunc = Mmanfunc
+        http_header: Opt_http_header = Opt_http_header()
+        http_header.x_mman_enable = 'YES'
+        http_header.user_agent = mmanfunc.createstr_cmdname(
+            os2, lang, arch) + '/{0}'.format(version)
+        roottomlobj = Man_roottoml()
+        roottomlobj.og_vernamekey = vernamekey
+        roottomlobj.og_manhashfpath = manhashfpath
+        roottomlobj.og_roottomlfpath = ''
+        roottomlobj.og_manenv_os2 = os2
+        roottomlobj.og_manenv_lang = lang
+        roottomlobj.og_manenv_arch = arch
+        roottomlobj.og_cmdversion = version
+        roottomlobj.og_cmddate = versiondate
+        roottomlobj.og_cachebackend = cache.backend.name
+        roottomlobj.og_rooturls = cache.load_rooturls()
+        roottomlobj.og_http_header = http_header
+        tomldic: dict = roottomlobj.make()
+        if uselatest and cache.get_bloom_latest()[0] != roottomlobj.mantomlhashdg:
+            subr.store_bloom(cache, roottomlobj.mantomlhashdg, tomldic)
+            subr.store_complete(cache, tomldic)
+        print_fastestdomain = False
+        if print_fastestdomain:
+            print('fastestdomain: ', roottomlobj.fastestdomain)
+        cache.store_rooturls(roottomlobj.rooturls)
+        http_header.x_mman_roottomlid = roottomlobj.og_http_header.x_mman_roottomlid
+        http_header.x_mman_mantomlid = roottomlobj.og_http_header.x_mman_mantomlid
+        return http_header, roottomlobj, tomldic
+
+    @staticmethod
+    def resolve_roottoml_into(retlist: list, *args):
+        try:
+            retlist.append(_Main_man.resolve_roottoml(*args))
+        except BaseException as e:
+            retlist.append(e)
+        return
+
+    @staticmethod
+    def make_bilingual_cache(cache: Man_cache, os2: str, otherlang: str, arch: str,
+                             version: str, versiondate: str) -> Man_cache:
+        errmes: str = ''
+        if os2 not in _Main_man._bilingual_os2:
+            errmes = 'Error: Bilingual mode is supported on FreeBSD only. [{0}]'.format(
+                os2)
+            raise MmanStdError(errmes)
+        othercache = Man_cache()
+        othercache.init(os2, otherlang, arch, version, versiondate)
+        othercache.mktempdir_ifnot()
+        othercache.set_backend(cache.backend.name)
+        return othercache
+
+    @staticmethod
+    def load_pagers(jobs: list, normform: str) -> list[str]:
+        subr = _Main_man
+        errmes: str = ''
+        rendered: list = [None for job in jobs]
+        pagerstrs: list = ['' for job in jobs]
+        fetched: list = [None for job in jobs]
+        if Man_cache.paranoid != True:
+            for i, job in enumerate(jobs):
+                hit, s = job.cache.get_render(job.manpg.hashdg, normform,
+                                              subr.render_version)
+                rendered[i] = s if hit else None
+
+        def fetch(i: int, job: Np_pagerjob):
+            try:
+                fetched[i] = subr.getstring_pagerurl(job.manpg.pagerurls, job.manpg.hashdg,
+                                                     job.http_header, job.fastestdomain)
+            except BaseException as e:
+                fetched[i] = e
+            return
+        threads: list = list()
+        for i, job in enumerate(jobs):
+            if rendered[i] != None:
+                continue
+            hit, pagerstrs[i] = job.pcache.get_pager(job.manpg.pagerurls[0])
+            if hit:
+                continue
+            thobj = threading.Thread(target=fetch, args=(i, job), daemon=True)
+            thobj.start()
+            threads.append(thobj)
+        [thobj.join() for thobj in threads]
+        for i, job in enumerate(jobs):
+            if rendered[i] != None:
+                continue
+            if isinstance(fetched[i], BaseException):
+                raise fetched[i]
+            manpg: Man_mantoml_retmake = job.manpg
+            gzbys: bytes = b''
+            if fetched[i] != None:
+                pagerstrs[i], gzbys = fetched[i]
+            if pagerstrs[i] == '':
+                errmes = 'Error: Not found the url. [{0}]'.format(
+                    manpg.pagerurls[0])
+                raise MmanStdError(errmes)
+            job.pcache.store_pager(fetched[i] == None, manpg.pagerurls[0], gzbys)
+            subr.index_apropos(job.cache, manpg.fname, manpg.hashdg, pagerstrs[i])
+            rendered[i] = subr.render_pager(pagerstrs[i], normform)
+            job.cache.store_render(manpg.hashdg, normform,
+                                   subr.render_version, rendered[i])
+        return rendered
+
 
 class Main_manXXYY(object):
     version:     typing.Final[str] = '0.0.10'
@@ -1304,6 +2151,28 @@ class Main_manXXYY(object):
              '      Show man 1 page list.',
              '  $ {0} --listos'.format(cmdname),
              '      Show os name list of man.',
+             '  $ {0} --search PATTERN'.format(cmdname),
+             '      Show man pages whose name starts with or contains PATTERN.',
+             '  $ {0} -k WORD'.format(cmdname),
+             '      Search WORD in the man pages read before. (apropos)',
+             '  $ {0} --cachebackend sqlite ls'.format(cmdname),
+             '      Keep man pages and man.toml in one SQLite database. (file, sqlite)',
+             '  $ {0} --hotcache-size 64 ls'.format(cmdname),
+             '      Keep up to 64 MiB of rendered pages read twice or more. (default: 32)',
+             '  $ {0} --paranoid ls'.format(cmdname),
+             '      Re-hash every cached file with SHA3-256 on read.',
+             '  $ {0} --builtin-pager ls'.format(cmdname),
+             '      Use the built-in pager. (/:search, ]/[:next/prev section, s:go to section, w:wrap)',
+             '  $ {0} --cat ls > ls.txt'.format(cmdname),
+             '      Write the plain text to stdout without pager. (default when not a tty)',
+             '  $ {0} --all-sections printf'.format(cmdname),
+             '      Show the man pages of all sections. e.g. printf(1), printf(3)',
+             '  $ {0} --bilingual ls'.format(cmdname),
+             '      Show the English and Japanese man side by side. (FreeBSD only)',
+             '  $ {0} --bilingual-interleave ls'.format(cmdname),
+             '      Show the English and Japanese man paragraph by paragraph.',
+             '  $ eval "$({0} --complete-script bash)"'.format(cmdname),
+             '      Enable man name completion on bash. (bash, zsh, fish)',
              '']
         meses_eng =\
             ['{0} written by MikeTurkey'.format(cmdname),
@@ -1340,6 +2209,28 @@ class Main_manXXYY(object):
              '      Show man 1 page list.',
              '  $ {0} --listos'.format(cmdname),
              '      Show os name list of man.',
+             '  $ {0} --search PATTERN'.format(cmdname),
+             '      Show man pages whose name starts with or contains PATTERN.',
+             '  $ {0} -k WORD'.format(cmdname),
+             '      Search WORD in the man pages read before. (apropos)',
+             '  $ {0} --cachebackend sqlite ls'.format(cmdname),
+             '      Keep man pages and man.toml in one SQLite database. (file, sqlite)',
+             '  $ {0} --hotcache-size 64 ls'.format(cmdname),
+             '      Keep up to 64 MiB of rendered pages read twice or more. (default: 32)',
+             '  $ {0} --paranoid ls'.format(cmdname),
+             '      Re-hash every cached file with SHA3-256 on read.',
+             '  $ {0} --builtin-pager ls'.format(cmdname),
+             '      Use the built-in pager. (/:search, ]/[:next/prev section, s:go to section, w:wrap)',
+             '  $ {0} --cat ls > ls.txt'.format(cmdname),
+             '      Write the plain text to stdout without pager. (default when not a tty)',
+             '  $ {0} --all-sections printf'.format(cmdname),
+             '      Show the man pages of all sections. e.g. printf(1), printf(3)',
+             '  $ {0} --bilingual ls'.format(cmdname),
+             '      Show the English and Japanese man side by side. (FreeBSD only)',
+             '  $ {0} --bilingual-interleave ls'.format(cmdname),
+             '      Show the English and Japanese man paragraph by paragraph.',
+             '  $ eval "$({0} --complete-script bash)"'.format(cmdname),
+             '      Enable man name completion on bash. (bash, zsh, fish)',
              '']
         new_meses: list = list()
         new_meses = meses_eng if lang == 'eng' else meses
@@ -1412,7 +2303,10 @@ class Main_manXXYY(object):
     @staticmethod
     def make_initopt():
         opt = types.SimpleNamespace(manhashfpath='', mannum='', manname='',
-                                    listos=False, listman=False, release='',
+                                    listos=False, listman=False, release='', search='', apropos='',
+                                    cachebackend='file', hotcachesize=-1, paranoid=False,
+                                    builtinpager=False, cat=False,
+                                    allsections=False, bilingual='',
                                     listman1=False, listman2=False, listman3=False,
                                     listman4=False, listman5=False, listman6=False,
                                     listman7=False, listman8=False, listman9=False,
@@ -1420,21 +2314,34 @@ class Main_manXXYY(object):
         return opt
 
     def main(self, os2: str = '', lang: str = '', arch: str = '',
-             gui: bool = False, manname: str = '', mannum: str = '', listman: str = '') -> str:
+             gui: bool = False, manname: str = '', mannum: str = '', listman: str = '',
+             search: str = '', apropos: str = '') -> str:
         mainfunc = Mainfunc
         _main_man = _Main_man
-        mmanfunc = Mmanfunc
         self.set_manenv(os2, lang, arch)
         cache = Man_cache()
         cache.init(os2, lang, arch, self.version, self.versiondate)
         cache.mktempdir_ifnot()
+        Man_resolver.set_cachedir(cache.tmpdir)
+        Man_circuitbreaker.set_cachedir(cache.tmpdir)
         if not gui:
             arg1, arg2, opt = self.create_mainargs()
+            cache.set_backend(opt.cachebackend)
+            Man_cache.paranoid = opt.paranoid
+            if opt.hotcachesize >= 0:
+                Man_hottier.maxbytes = opt.hotcachesize * 1024 * 1024
+            if sys.stdout.isatty() != True:
+                opt.cat = True
             vernamekey = opt.release if opt.release != '' else '@LATEST-RELEASE'
             if opt.listos:
                 _main_man.show_listos(self.manenv_os2, self.manenv_lang, self.manenv_arch, cache,
                                       self.version, self.versiondate)
                 exit(0)
+            if opt.apropos != '':
+                _main_man.show_apropos(opt.apropos, False, cache)
+            if opt.search != '':
+                _main_man.show_search(opt.search, self.manenv_os2, self.manenv_lang,
+                                      self.manenv_arch, False, cache, self.version, self.versiondate)
             if opt.listman:
                 _main_man.show_listman(vernamekey, self.manenv_os2, self.manenv_lang,
                                        self.manenv_arch, False, cache, self.version, self.versiondate)
@@ -1449,7 +2356,8 @@ class Main_manXXYY(object):
                 raise MmanStdError(errmes)
             if opt.license:
                 _main_man.show_license(os2, lang, arch)
-            self.check_terminal(lang)
+            if opt.cat != True:
+                self.check_terminal(lang)
             if arg2 == '':
                 opt.manname = arg1
             else:
@@ -1465,35 +2373,42 @@ class Main_manXXYY(object):
             s = _main_man.show_listman(vernamekey, self.manenv_os2, self.manenv_lang,
                                        self.manenv_arch, gui, cache, self.version, self.versiondate)
             return s
+        if gui == True and apropos != '':
+            s = _main_man.show_apropos(apropos, gui, cache)
+            return s
+        if gui == True and search != '':
+            s = _main_man.show_search(search, self.manenv_os2, self.manenv_lang,
+                                      self.manenv_arch, gui, cache, self.version, self.versiondate)
+            return s
         chktpl: tuple = ('1', '2', '3', '4', '5', '6', '7', '8', '9')
         if gui == True and (listman in chktpl):
             n = int(listman)
             s = _main_man.show_listman_n(n, vernamekey, self.manenv_os2, self.manenv_lang,
                                          self.manenv_arch, gui, cache, self.version, self.versiondate)
             return s
-        http_header: Opt_http_header = Opt_http_header()
-        http_header.x_mman_enable = 'YES'
-        http_header.user_agent = mmanfunc.createstr_cmdname(
-            os2, lang, arch) + '/{0}'.format(self.version)
-        rooturls = cache.load_rooturls()
-        roottomlobj = Man_roottoml()
-        roottomlobj.og_vernamekey = vernamekey
-        roottomlobj.og_manhashfpath = opt.manhashfpath
-        roottomlobj.og_roottomlfpath = ''
-        roottomlobj.og_manenv_os2 = self.manenv_os2
-        roottomlobj.og_manenv_lang = self.manenv_lang
-        roottomlobj.og_manenv_arch = self.manenv_arch
-        roottomlobj.og_cmdversion = self.version
-        roottomlobj.og_cmddate = self.versiondate
-        roottomlobj.og_rooturls = cache.load_rooturls()
-        roottomlobj.og_http_header = http_header
-        tomldic = roottomlobj.make()
-        print_fastestdomain = False
-        if print_fastestdomain:
-            print('fastestdomain: ', roottomlobj.fastestdomain)
-        cache.store_rooturls(roottomlobj.rooturls)
-        http_header.x_mman_roottomlid = roottomlobj.og_http_header.x_mman_roottomlid
-        http_header.x_mman_mantomlid = roottomlobj.og_http_header.x_mman_mantomlid
+        uselatest: typing.Final[bool] = vernamekey == '@LATEST-RELEASE' and opt.manhashfpath == ''
+        if uselatest and _main_man.is_missing_manname(cache, opt.mannum, opt.manname):
+            if gui:
+                return ''
+            errmes = _main_man.make_notfound_errmes(
+                cache, cache.get_mantoml_last(), opt.manname)
+            raise MmanStdError(errmes)
+        bilingual: typing.Final[str] = opt.bilingual if gui != True else ''
+        if bilingual != '':
+            otherlang: typing.Final[str] = 'eng' if lang == 'jpn' else 'jpn'
+            othercache: Man_cache = _main_man.make_bilingual_cache(
+                cache, os2, otherlang, arch, self.version, self.versiondate)
+            otherresolved: list = list()
+            otherthread = threading.Thread(
+                target=_main_man.resolve_roottoml_into,
+                args=(otherresolved, othercache, os2, otherlang, arch,
+                      vernamekey, opt.manhashfpath, self.version,
+                      self.versiondate, uselatest),
+                daemon=True)
+            otherthread.start()
+        http_header, roottomlobj, tomldic = _main_man.resolve_roottoml(
+            cache, os2, lang, arch, vernamekey, opt.manhashfpath, self.version,
+            self.versiondate, uselatest)
         mantomlobj = Man_mantoml()
         mantomlobj.og_tomldic = tomldic.copy()
         mantomlobj.og_osname_root = roottomlobj.osname
@@ -1505,37 +2420,124 @@ class Main_manXXYY(object):
         pagerurls: tuple = manpg.pagerurls
         hashdg: str = manpg.hashdg
         if len(manpg.pagerurls) == 0 and gui == False:
-            errmes = 'Error: Not found the manual name. [{0}]'.format(
-                opt.manname)
+            errmes = _main_man.make_notfound_errmes(
+                cache, roottomlobj.mantomlhashdg, opt.manname, tomldic)
             raise MmanStdError(errmes)
         elif len(manpg.pagerurls) == 0 and gui == True:
             return ''
         pagerstr: str = ''
         gzbys: bytes = b''
         pcache = Man_pagercache()
-        pcache.init(cache.tmpdir)
+        pcache.init(cache.tmpdir, cache.backend)
         pagerurl: str = manpg.pagerurls[0]
-        hit, pagerstr = pcache.get_pager(pagerurl)
-        hit = False
-        if hit != True:
-            pagerstr, gzbys = _main_man.getstring_pagerurl(manpg.pagerurls, manpg.hashdg,
-                                                           http_header,
-                                                           roottomlobj.fastestdomain)
-        if pagerstr == '':
-            errmes = 'Error: Not found the url. [{0}]'.format(pagerurl)
-            raise MmanStdError(errmes)
-        pcache.store_pager(hit, pagerurl, gzbys)
-        if gui:
+        normform: typing.Final[str] = _main_man.make_normform()
+        rendered: bool = False
+        renderfpath: pathlib.Path | None = None
+        catmode: typing.Final[bool] = gui != True and opt.cat
+        builtinpager: typing.Final[bool] = gui != True and catmode != True and \
+            opt.builtinpager and is_builtinpager_available()
+        streamed: bool = False
+        allsections: typing.Final[bool] = gui != True and opt.allsections and \
+            opt.mannum == '' and bilingual == ''
+        pagertitle: str = manpg.fname
+        pagerdigest: str = manpg.hashdg
+        if allsections:
+            manpgs: typing.Final[list] = mantomlobj.make_all()
+            jobs: list = [Np_pagerjob(manpg=np, cache=cache, pcache=pcache,
+                                      http_header=http_header,
+                                      fastestdomain=roottomlobj.fastestdomain)
+                          for np in manpgs]
+            s = '\n'.join(_main_man.load_pagers(jobs, normform))
+            pagertitle = ' '.join([np.fname for np in manpgs])
+            pagerdigest = ''
+            rendered = True
+        if bilingual != '':
+            otherthread.join()
+            if isinstance(otherresolved[0], BaseException):
+                raise otherresolved[0]
+            otherheader, otherroottomlobj, othertomldic = otherresolved[0]
+            othermantomlobj = Man_mantoml()
+            othermantomlobj.og_tomldic = othertomldic.copy()
+            othermantomlobj.og_osname_root = otherroottomlobj.osname
+            othermantomlobj.og_mannum = manpg.fname.rsplit('.', 1)[1]
+            othermantomlobj.og_manname = opt.manname
+            othermantomlobj.og_baseurls = otherroottomlobj.baseurls
+            othermantomlobj.og_fnamemode = 'hash'
+            othermanpg: Man_mantoml_retmake = othermantomlobj.make()
+            if len(othermanpg.pagerurls) == 0:
+                errmes = _main_man.make_notfound_errmes(
+                    othercache, otherroottomlobj.mantomlhashdg, manpg.fname, othertomldic)
+                raise MmanStdError(errmes)
+            otherpcache = Man_pagercache()
+            otherpcache.init(othercache.tmpdir, othercache.backend)
+            jobs = [Np_pagerjob(manpg=manpg, cache=cache, pcache=pcache,
+                                http_header=http_header,
+                                fastestdomain=roottomlobj.fastestdomain),
+                    Np_pagerjob(manpg=othermanpg, cache=othercache, pcache=otherpcache,
+                                http_header=otherheader,
+                                fastestdomain=otherroottomlobj.fastestdomain)]
+            texts: list = _main_man.load_pagers(jobs, normform)
+            if lang != 'eng':
+                texts.reverse()
+            columns: typing.Final[int] = shutil.get_terminal_size().columns
+            if bilingual == 'interleave':
+                s = Man_bilingual.interleave(texts[0], texts[1])
+            else:
+                s = Man_bilingual.sidebyside(texts[0], texts[1], columns)
+            pagerdigest = ''
+            rendered = True
+        if gui != True and Man_cache.paranoid != True and allsections != True and \
+                bilingual == '':
+            if builtinpager:
+                renderfpath = cache.get_render_fpath(manpg.hashdg, normform,
+                                                     _main_man.render_version)
+                rendered = renderfpath != None
+            if rendered != True:
+                rendered, s = cache.get_render(manpg.hashdg, normform,
+                                               _main_man.render_version)
+        if catmode and rendered != True:
+            gzcache: bytes | None = pcache.get_pagergz(pagerurl)
+            if gzcache != None:
+                try:
+                    _main_man.write_stdout(
+                        _main_man.iter_gzipchunks(gzcache, normform))
+                except (EOFError, zlib.error, UnicodeDecodeError):
+                    errmes = 'Error: Broken pager cache. [{0}]'.format(pagerurl)
+                    raise MmanStdError(errmes)
+                streamed = True
+        if rendered != True and streamed != True:
+            hit, pagerstr = pcache.get_pager(pagerurl)
+            if hit != True:
+                pagerstr, gzbys = _main_man.getstring_pagerurl(manpg.pagerurls, manpg.hashdg,
+                                                               http_header,
+                                                               roottomlobj.fastestdomain)
+            if pagerstr == '':
+                errmes = 'Error: Not found the url. [{0}]'.format(pagerurl)
+                raise MmanStdError(errmes)
+            pcache.store_pager(hit, pagerurl, gzbys)
+            _main_man.index_apropos(
+                cache, manpg.fname, manpg.hashdg, pagerstr)
+            if gui:
+                cache.remove_oldcache()
+                return pagerstr
+            s = _main_man.render_pager(pagerstr, normform)
+            cache.store_render(manpg.hashdg, normform,
+                               _main_man.render_version, s)
+            if builtinpager:
+                renderfpath = cache.get_render_fpath(manpg.hashdg, normform,
+                                                     _main_man.render_version)
+        if catmode:
+            if streamed != True:
+                _main_man.write_stdout(_main_man.iter_textchunks(s))
             cache.remove_oldcache()
-            return pagerstr
-        s = pagerstr
-        if sys.platform == 'darwin':
-            s = unicodedata.normalize('NFD', s)
-        elif sys.platform == 'win32':
-            s = unicodedata.normalize('NFC', s)
-        s = _main_man.norm_punctuation(s)
-        self.change_pager(lang)
-        pydoc.pager(s)
+            if opt.showtmpdir:
+                print('tmpdir:', cache.tmpdir, file=sys.stderr)
+            exit(0)
+        if builtinpager:
+            builtin_pager(s, renderfpath, pagertitle, pagerdigest)
+        else:
+            self.change_pager(lang)
+            pydoc.pager(s)
         print('OSNAME(man):', mantomlobj.osname)
         print(roottomlobj.message)
         cache.remove_oldcache()
@@ -1549,11 +2551,17 @@ class Main_manXXYY(object):
         arg2 = ''
         on_manhash = False
         on_release = False
+        on_search = False
+        on_apropos = False
+        on_cachebackend = False
+        on_hotcachesize = False
         listmandict: dict = {'--listman1': 'listman1', '--listman2': 'listman2',
                              '--listman3': 'listman3', '--listman4': 'listman4',
                              '--listman5': 'listman5', '--listman6': 'listman6',
                              '--listman7': 'listman7', '--listman8': 'listman8',
                              '--listman9': 'listman9'}
+        if is_complete_args(sys.argv):
+            main_complete(self.cmdname)
         for arg in sys.argv[1:]:
             if on_manhash:
                 opt.manhashfpath = os.path.abspath(arg)
@@ -1563,12 +2571,66 @@ class Main_manXXYY(object):
                 opt.release = arg
                 on_release = False
                 continue
+            if on_search:
+                opt.search = arg
+                on_search = False
+                continue
+            if on_apropos:
+                opt.apropos = arg
+                on_apropos = False
+                continue
+            if on_cachebackend:
+                if arg not in ('file', 'sqlite'):
+                    errmes = 'Error: Invalid --cachebackend. [{0}]'.format(arg)
+                    print(errmes, file=sys.stderr)
+                    exit(1)
+                opt.cachebackend = arg
+                on_cachebackend = False
+                continue
+            if on_hotcachesize:
+                if arg.isdigit() != True:
+                    errmes = 'Error: Invalid --hotcache-size. [{0}]'.format(arg)
+                    print(errmes, file=sys.stderr)
+                    exit(1)
+                opt.hotcachesize = int(arg)
+                on_hotcachesize = False
+                continue
             if arg == '--manhash':
                 on_manhash = True
                 continue
             if arg == '--release':
                 on_release = True
                 continue
+            if arg == '--search':
+                on_search = True
+                continue
+            if arg in ('-k', '--apropos'):
+                on_apropos = True
+                continue
+            if arg == '--cachebackend':
+                on_cachebackend = True
+                continue
+            if arg == '--hotcache-size':
+                on_hotcachesize = True
+                continue
+            if arg == '--paranoid':
+                opt.paranoid = True
+                continue
+            if arg == '--builtin-pager':
+                opt.builtinpager = True
+                continue
+            if arg == '--cat':
+                opt.cat = True
+                continue
+            if arg == '--all-sections':
+                opt.allsections = True
+                continue
+            if arg == '--bilingual':
+                opt.bilingual = 'sidebyside'
+                continue
+            if arg == '--bilingual-interleave':
+                opt.bilingual = 'interleave'
+                continue
             if arg in ('--help', '-h'):
                 self.show_helpmes(self.manenv_os2, self.manenv_lang)
                 exit(0)